@@ -3,16 +3,32 @@
 from __future__ import annotations
 
 
+def _text_of(part: dict) -> str:
+    """Extract the text of a single rich content part (one lookup per key)."""
+    text = part.get("text")
+    if text:
+        return text if isinstance(text, str) else str(text)
+    content = part.get("content")
+    if content:
+        return content if isinstance(content, str) else str(content)
+    return ""
+
+
 def normalize_content_to_text(content: object) -> str:
-    """Collapse rich content parts (Responses API) into plain text."""
+    """Collapse rich content parts (Responses API) into plain text.
+
+    The overwhelmingly common case is a plain str, so check that first
+    (exact type check — no MRO walk) before the list/dict handling.
+    """
+    if type(content) is str:
+        return content.strip() if content else ""
     if isinstance(content, list):
-        parts: list[str] = []
-        for part in content:
-            if isinstance(part, dict):
-                parts.append(str(part.get("text") or part.get("content") or ""))
-            elif isinstance(part, str):
-                parts.append(part)
-        return " ".join(p for p in parts if p).strip()
+        parts = [
+            _text_of(p) if isinstance(p, dict) else p
+            for p in content
+            if isinstance(p, (dict, str))
+        ]
+        return " ".join(filter(None, parts)).strip()
     if isinstance(content, dict):
-        return str(content.get("text") or content.get("content") or "").strip()
+        return _text_of(content).strip()
     return str(content or "").strip()
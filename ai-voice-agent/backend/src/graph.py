@@ -1,7 +1,9 @@
 """Graph construction shared between CLI and web server."""
 
+from langgraph.cache.memory import InMemoryCache
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import START, StateGraph
+from langgraph.types import CachePolicy
 
 from src.nodes import (
     SupervisorState,
@@ -19,6 +21,17 @@ from src.nodes import (
 )
 
 
+def _messages_cache_key(state) -> str:
+    """Cache key for specialist nodes — identical message history, same reply."""
+    return str(hash(tuple((m.type, str(m.content)) for m in state.get("messages", []))))
+
+
+# Specialist agents are pure functions of the message history (plus a fixed
+# prompt), so identical re-runs (e.g. user repeats "cheese pizza") can be
+# served from LangGraph's node cache instead of redoing the LLM+tool calls.
+_AGENT_CACHE_POLICY = CachePolicy(key_func=_messages_cache_key, ttl=300)
+
+
 def build_graph(mode: str = "none"):
     """Compile and return the LangGraph instance (with checkpointer for interrupts)."""
     graph = StateGraph(SupervisorState)
@@ -34,14 +47,14 @@ def build_graph(mode: str = "none"):
 
     if nodes:
         graph.add_node("supervisor", nodes["supervisor"])
-        graph.add_node("order_agent", nodes["order_agent"])
-        graph.add_node("pizza_agent", nodes["pizza_agent"])
-        graph.add_node("delivery_agent", nodes["delivery_agent"])
+        graph.add_node("order_agent", nodes["order_agent"], cache_policy=_AGENT_CACHE_POLICY)
+        graph.add_node("pizza_agent", nodes["pizza_agent"], cache_policy=_AGENT_CACHE_POLICY)
+        graph.add_node("delivery_agent", nodes["delivery_agent"], cache_policy=_AGENT_CACHE_POLICY)
     else:
         graph.add_node("supervisor", supervisor_command_node)
-        graph.add_node("order_agent", order_agent_node)
-        graph.add_node("pizza_agent", pizza_agent_node)
-        graph.add_node("delivery_agent", delivery_agent_node)
+        graph.add_node("order_agent", order_agent_node, cache_policy=_AGENT_CACHE_POLICY)
+        graph.add_node("pizza_agent", pizza_agent_node, cache_policy=_AGENT_CACHE_POLICY)
+        graph.add_node("delivery_agent", delivery_agent_node, cache_policy=_AGENT_CACHE_POLICY)
 
     # Interrupt nodes (these don't use the LLM, so no guardrails variant needed)
     graph.add_node("wait_for_user_after_pizza", wait_for_user_after_pizza)
@@ -50,4 +63,4 @@ def build_graph(mode: str = "none"):
     graph.add_node("wait_for_user_after_guardrails", wait_for_user_after_guardrails)
 
     graph.add_edge(START, "supervisor")
-    return graph.compile(checkpointer=MemorySaver())
+    return graph.compile(checkpointer=MemorySaver(), cache=InMemoryCache())
@@ -0,0 +1,33 @@
+"""Non-blocking logging setup shared across the backend."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import logging.handlers
+import queue
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def setup_queue_logging(level: int = logging.INFO) -> None:
+    """Route root logging through a queue so log I/O never blocks the event loop.
+
+    Handlers attach to a background QueueListener thread that writes to
+    stderr; callers on the asyncio loop only pay for enqueueing a record.
+    Safe to call more than once — setup happens on the first call only.
+    """
+    global _listener
+    if _listener is not None:
+        return
+    log_queue: queue.Queue = queue.Queue(-1)
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+    )
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, handler)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import logging
 import os
 import threading
 from typing import Annotated, Literal
@@ -13,11 +16,13 @@ from langgraph.prebuilt import create_react_agent
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 from langgraph.graph.message import add_messages
-from langgraph.types import Command, interrupt
+from langgraph.types import Command, Send, interrupt
 from pydantic import BaseModel
 from typing_extensions import TypedDict
 
 from src.content_utils import normalize_content_to_text
+from src.response_cache import ResponseCache
+from src.router_cache import SemanticCache
 from src.prompts import (
     DELIVERY_AGENT_PROMPT,
     ORDER_AGENT_PROMPT,
@@ -32,6 +37,8 @@ from src.tools import (
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 MODEL_NAME = os.getenv("MODEL_NAME", "MODEL_NAME")
 BASE_URL = os.getenv("BASE_URL", "BASE_URL")
 API_KEY = os.getenv("API_KEY", "API_KEY")
@@ -109,9 +116,8 @@ GUARDRAILS_DETECTORS_OUTPUT_SCREEN = {
 _guardrails_tls = threading.local()
 
 
-def _log_guardrails_response(response: httpx.Response) -> None:
-    """httpx event hook — log and capture detections/warnings from orchestrator."""
-    response.read()
+def _capture_guardrails_payload(response: httpx.Response) -> None:
+    """Log and stash detections/warnings from an orchestrator response body."""
     try:
         data = response.json()
         detections = data.get("detections")
@@ -120,13 +126,25 @@ def _log_guardrails_response(response: httpx.Response) -> None:
         _guardrails_tls.last_detections = detections
         _guardrails_tls.last_warnings = warnings
         if detections:
-            print(f"[guardrails] Detections: {json.dumps(detections, indent=2)}", flush=True)
+            logger.info("[guardrails] Detections: %s", json.dumps(detections, indent=2))
         if warnings:
-            print(f"[guardrails] Warnings: {json.dumps(warnings, indent=2)}", flush=True)
+            logger.info("[guardrails] Warnings: %s", json.dumps(warnings, indent=2))
     except Exception:
         pass
 
 
+def _log_guardrails_response(response: httpx.Response) -> None:
+    """httpx event hook (sync client) — capture detections/warnings."""
+    response.read()
+    _capture_guardrails_payload(response)
+
+
+async def _alog_guardrails_response(response: httpx.Response) -> None:
+    """httpx event hook (async client) — the ainvoke call sites go through here."""
+    await response.aread()
+    _capture_guardrails_payload(response)
+
+
 def _trace_guardrails(label: str) -> None:
     """Log last guardrails detections/warnings to MLFlow active span."""
     detections = getattr(_guardrails_tls, "last_detections", None)
@@ -148,8 +166,20 @@ def _trace_guardrails(label: str) -> None:
         pass
 
 
+# Both clients carry the hook: langchain builds the sync path from
+# http_client and the ainvoke path from http_async_client — without the
+# latter, async calls would use a default hook-less AsyncClient and the
+# detection logging/tracing would silently stop.
 _guardrails_http_client = httpx.Client(event_hooks={"response": [_log_guardrails_response]})
-_GUARDRAILS_LLM_COMMON = {**_LLM_COMMON, "streaming": False, "http_client": _guardrails_http_client}
+_guardrails_async_http_client = httpx.AsyncClient(
+    event_hooks={"response": [_alog_guardrails_response]}
+)
+_GUARDRAILS_LLM_COMMON = {
+    **_LLM_COMMON,
+    "streaming": False,
+    "http_client": _guardrails_http_client,
+    "http_async_client": _guardrails_async_http_client,
+}
 
 if GUARDRAILS_URL:
     guardrails_llm = ChatOpenAI(
@@ -171,7 +201,6 @@ if GUARDRAILS_URL:
 # ============================================================
 # Agent Creation
 # ============================================================
-supervisor_agent = create_react_agent(model=llm, tools=[])
 order_agent = create_react_agent(model=llm, tools=[add_to_order])
 pizza_agent = create_react_agent(model=llm, tools=[get_pizza_type])
 delivery_agent = create_react_agent(model=llm, tools=[choose_delivery])
@@ -204,19 +233,19 @@ def _is_nemo_blocked(text: str) -> bool:
     return any(p in text for p in _NEMO_BLOCKED_PATTERNS)
 
 
-def _screen_nemo_input(user_text: str) -> None:
+async def _screen_nemo_input(user_text: str) -> None:
     """Screen user input through NeMo guardrails. Raises if blocked."""
-    result = nemo_llm.invoke([HumanMessage(content=user_text)])
+    result = await nemo_llm.ainvoke([HumanMessage(content=user_text)])
     response_text = normalize_content_to_text(result.content)
     if _is_nemo_blocked(response_text):
         raise ValueError(f"[nemo] Input blocked: {response_text}")
 
 
-def _screen_nemo_output(agent_text: str) -> None:
+async def _screen_nemo_output(agent_text: str) -> None:
     """Screen agent output through NeMo guardrails. Raises if blocked."""
     if not agent_text:
         return
-    result = nemo_llm.invoke([HumanMessage(content=agent_text)])
+    result = await nemo_llm.ainvoke([HumanMessage(content=agent_text)])
     response_text = normalize_content_to_text(result.content)
     if _is_nemo_blocked(response_text):
         raise ValueError(f"[nemo] Output blocked: {response_text}")
@@ -232,12 +261,16 @@ class SupervisorState(TypedDict, total=False):
         list, add_messages
     ]  # Conversation history (uses add_messages reducer)
     pizza_type: Annotated[str, "The type of pizza the user wants to order."]
+    fanout: bool  # Set on Send payloads when specialists run in parallel
 
 
 class SupervisorDecision(BaseModel):
     """Structured output from supervisor for routing decisions."""
 
     next_agent: Literal["order_agent", "pizza_agent", "delivery_agent", "none"]
+    next_agents: list[
+        Literal["order_agent", "pizza_agent", "delivery_agent"]
+    ] = []  # All specialists needed when the utterance has multiple intents
     pizza_type: Annotated[str, "The type of pizza the user wants to order."]
     response: str = ""  # Direct response if no routing needed
 
@@ -245,33 +278,170 @@ class SupervisorDecision(BaseModel):
 # ============================================================
 # Helper Functions
 # ============================================================
-def _invoke_agent(agent, prompt: str, messages: list, agent_name: str):
+# Bound once at import — with_structured_output builds a fresh Runnable
+# (schema conversion, tool spec) on every call otherwise.
+supervisor_router = llm.with_structured_output(SupervisorDecision)
+
+# One SystemMessage per prompt, built once — saves a Pydantic model
+# construction per agent invocation.
+_SUP_SYS = SystemMessage(content=SUPERVISOR_PROMPT)
+_PIZZA_SYS = SystemMessage(content=PIZZA_AGENT_PROMPT)
+_ORDER_SYS = SystemMessage(content=ORDER_AGENT_PROMPT)
+_DELIVERY_SYS = SystemMessage(content=DELIVERY_AGENT_PROMPT)
+_SUPERVISOR_SYS = [_SUP_SYS]
+
+# Routing cache — pizza-shop intents recur constantly ("order a pizza",
+# greetings), so cache hits skip the routing LLM round-trip entirely.
+_router_cache = SemanticCache()
+
+# The event loop keeps only weak references to tasks, so off-path cache
+# fills need a strong reference until they finish or they can be
+# garbage-collected mid-flight.
+_PENDING_CACHE_FILLS: set[asyncio.Task] = set()
+
+# Reply cache — keyed on the full conversation state, so it only fires
+# when an identical exchange recurs (persistent across restarts when
+# diskcache is installed, unlike the per-process node cache).
+_response_cache = ResponseCache()
+
+
+def _response_cache_key(agent_name: str, messages: list) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(agent_name.encode())
+    for m in messages:
+        digest.update(m.type.encode())
+        digest.update(b":")
+        digest.update(normalize_content_to_text(m.content).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _recent(messages: list, k: int = 8) -> list:
+    """Rolling window of the last k messages for routing decisions.
+
+    Prompt tokens otherwise grow with the whole conversation on every
+    turn. Walks further back if needed so the window opens on a
+    HumanMessage rather than mid-exchange.
+    """
+    if len(messages) <= k:
+        return messages
+    start = len(messages) - k
+    while start > 0 and not isinstance(messages[start], HumanMessage):
+        start -= 1
+    return messages[start:]
+
+
+async def _route_decision(messages: list) -> SupervisorDecision:
+    """Make the supervisor routing decision, with a semantic cache in front."""
+    last_user = None
+    for m in reversed(messages):
+        if isinstance(m, HumanMessage):
+            last_user = normalize_content_to_text(m.content)
+            break
+
+    if last_user:
+        cached = await _router_cache.get(last_user)
+        # Serve routing decisions only. next_agent == "none" decisions
+        # carry the spoken reply itself, which was generated in some
+        # other conversation's context — replaying it would leak one
+        # session's content into another.
+        if cached is not None and cached.next_agent != "none":
+            logger.info("Supervisor: Router cache hit for %r", last_user)
+            return cached
+
+    decision: SupervisorDecision = await supervisor_router.ainvoke(
+        _SUPERVISOR_SYS + _recent(messages)
+    )
+
+    if last_user and decision.next_agent != "none":
+        # Fill the cache off the routing path — embedding the key can cost
+        # a network round-trip and the caller doesn't need to wait for it.
+        # Decisions that name a pizza_type are exact-match only: a 0.92
+        # cosine match can pair "pepperoni" phrasing with a "margherita"
+        # decision and corrupt the order.
+        task = asyncio.get_running_loop().create_task(
+            _router_cache.put(last_user, decision, embed=not decision.pizza_type)
+        )
+        _PENDING_CACHE_FILLS.add(task)
+        task.add_done_callback(_PENDING_CACHE_FILLS.discard)
+    return decision
+
+
+async def _invoke_agent(
+    agent,
+    sys_msg: SystemMessage,
+    messages: list,
+    agent_name: str,
+    cache_scope: str | None = None,
+):
     """Helper to invoke an agent and return formatted response.
 
     This consolidates the common pattern of:
-    1. Adding system prompt to messages
-    2. Invoking the agent subgraph
+    1. Adding the (precomputed) system prompt message to messages
+    2. Invoking the agent subgraph (async, so LLM/tool I/O overlaps
+       with other work on the event loop)
     3. Extracting and naming the response message
+
+    cache_scope overrides agent_name in the response-cache key when two
+    agents share a name but must not share cached replies (the FMS and
+    NeMo supervisors both answer as "supervisor", but each backend's
+    screening only runs at generation time — a hit from the other
+    backend would skip it).
     """
-    agent_input = {"messages": [SystemMessage(content=prompt)] + messages}
-    agent_result = agent.invoke(agent_input)
+    cache_key = _response_cache_key(cache_scope or agent_name, messages)
+    cached_text = _response_cache.get(cache_key)
+    if cached_text is not None:
+        logger.info("%s: Response cache hit", agent_name)
+        return AIMessage(content=cached_text, name=agent_name)
+
+    agent_input = {"messages": [sys_msg, *messages]}
+    agent_result = await agent.ainvoke(agent_input)
     response_message = agent_result["messages"][-1]
     response_message.name = agent_name
+
+    response_text = normalize_content_to_text(response_message.content)
+    if response_text:
+        _response_cache.put(cache_key, response_text)
     return response_message
 
 
-def supervisor_command_node(state: SupervisorState) -> Command:
+async def supervisor_command_node(state: SupervisorState) -> Command:
     """Supervisor for Command routing - uses structured output."""
-    decision: SupervisorDecision = llm.with_structured_output(
-        SupervisorDecision
-    ).invoke([SystemMessage(content=SUPERVISOR_PROMPT)] + state["messages"])
+    decision: SupervisorDecision = await _route_decision(state["messages"])
 
     if decision.next_agent == "none":
-        response = _invoke_agent(
-            supervisor_agent, SUPERVISOR_PROMPT, state["messages"], "supervisor"
-        )
+        # The structured-output call already produced the reply in
+        # decision.response — reuse it instead of a second LLM round-trip.
+        # Models do sometimes leave it empty despite the prompt nudge; an
+        # empty AIMessage would make _select_tts_text skip back to (and
+        # re-speak) the previous reply, so fall back to a plain
+        # completion in that case.
+        reply = decision.response
+        if not reply:
+            completion = await llm.ainvoke([_SUP_SYS, *state["messages"]])
+            reply = normalize_content_to_text(completion.content)
+        response = AIMessage(content=reply, name="supervisor")
         return Command(goto="__end__", update={"messages": [response]})
 
+    # Multi-intent utterances fan out to all needed specialists in
+    # parallel via the Send API; add_messages merges their replies.
+    # Fanned-out agents go straight to __end__ rather than their wait
+    # nodes so a single turn doesn't leave several interrupts pending.
+    targets = [a for a in decision.next_agents if a != decision.next_agent]
+    if targets:
+        update = {}
+        if decision.pizza_type != "":
+            update["pizza_type"] = decision.pizza_type
+        targets = [decision.next_agent] + targets
+        logger.info("Supervisor: Fanning out to %s", targets)
+        return Command(
+            goto=[
+                Send(agent, {"messages": state["messages"], "fanout": True})
+                for agent in targets
+            ],
+            update=update,
+        )
+
     update = {
         "messages": [
             AIMessage(content=f"Routing to {decision.next_agent}", name="supervisor")
@@ -280,43 +450,49 @@ def supervisor_command_node(state: SupervisorState) -> Command:
 
     if decision.pizza_type != "":
         update["pizza_type"] = decision.pizza_type
-        print(f"Supervisor: Extracted pizza_type='{decision.pizza_type}'")
+        logger.info("Supervisor: Extracted pizza_type='%s'", decision.pizza_type)
 
-    print(f"Supervisor: Routing to {decision.next_agent}")
+    logger.info("Supervisor: Routing to %s", decision.next_agent)
     return Command[str](goto=decision.next_agent, update=update)
 
 
-def pizza_agent_node(state: SupervisorState) -> Command:
+async def pizza_agent_node(state: SupervisorState) -> Command:
     """Pizza agent - chooses a pizza."""
-    print("Pizza Agent")
-    response = _invoke_agent(
-        pizza_agent, PIZZA_AGENT_PROMPT, state["messages"], "pizza_agent",
+    logger.info("Pizza Agent")
+    response = await _invoke_agent(
+        pizza_agent, _PIZZA_SYS, state["messages"], "pizza_agent",
     )
-    print("Pizza Agent: routed to wait_for_user_after_pizza")
+    if state.get("fanout"):
+        return Command(goto="__end__", update={"messages": [response]})
+    logger.info("Pizza Agent: routed to wait_for_user_after_pizza")
     return Command[str](
         goto="wait_for_user_after_pizza", update={"messages": [response]}
     )
 
 
-def order_agent_node(state: SupervisorState) -> Command:
+async def order_agent_node(state: SupervisorState) -> Command:
     """Order agent - adds items to the order."""
-    print("Order Agent")
-    response = _invoke_agent(
-        order_agent, ORDER_AGENT_PROMPT, state["messages"], "order_agent",
+    logger.info("Order Agent")
+    response = await _invoke_agent(
+        order_agent, _ORDER_SYS, state["messages"], "order_agent",
     )
-    print("Order Agent: routed to wait_for_user_after_order")
+    if state.get("fanout"):
+        return Command(goto="__end__", update={"messages": [response]})
+    logger.info("Order Agent: routed to wait_for_user_after_order")
     return Command[str](
         goto="wait_for_user_after_order", update={"messages": [response]}
     )
 
 
-def delivery_agent_node(state: SupervisorState) -> Command:
+async def delivery_agent_node(state: SupervisorState) -> Command:
     """Delivery agent - chooses a delivery option and asks for the address."""
-    print("Delivery Agent")
-    response = _invoke_agent(
-        delivery_agent, DELIVERY_AGENT_PROMPT, state["messages"], "delivery_agent",
+    logger.info("Delivery Agent")
+    response = await _invoke_agent(
+        delivery_agent, _DELIVERY_SYS, state["messages"], "delivery_agent",
     )
-    print("Delivery Agent: routed to wait_for_user_after_delivery")
+    if state.get("fanout"):
+        return Command(goto="__end__", update={"messages": [response]})
+    logger.info("Delivery Agent: routed to wait_for_user_after_delivery")
     return Command[str](
         goto="wait_for_user_after_delivery", update={"messages": [response]}
     )
@@ -363,7 +539,7 @@ GUARDRAILS_BLOCKED_MSG = "Unsuitable content detected, please rephrase your mess
 
 def _guardrails_blocked_command() -> Command:
     """Return a Command that interrupts with the guardrails blocked message."""
-    print("[guardrails] Content blocked by guardrails", flush=True)
+    logger.info("[guardrails] Content blocked by guardrails")
     return Command(
         goto="wait_for_user_after_guardrails",
         update={"messages": [AIMessage(content=GUARDRAILS_BLOCKED_MSG, name="guardrails")]},
@@ -378,7 +554,7 @@ def wait_for_user_after_guardrails(state: SupervisorState) -> Command:
     )
 
 
-def _screen_user_input(messages: list) -> None:
+async def _screen_user_input(messages: list) -> None:
     """Screen the user's latest message through guardrails input detectors.
 
     Sends only the latest user message (not full history) to avoid false
@@ -393,11 +569,11 @@ def _screen_user_input(messages: list) -> None:
     if not last_user_msg:
         return
 
-    guardrails_llm_input_only.invoke([HumanMessage(content=last_user_msg)])
+    await guardrails_llm_input_only.ainvoke([HumanMessage(content=last_user_msg)])
     _trace_guardrails("input_screen")
 
 
-def _screen_agent_output(response_text: str) -> None:
+async def _screen_agent_output(response_text: str) -> None:
     """Screen an agent's response through guardrails detectors.
 
     Sends the agent's response as a single user message and scans it
@@ -410,35 +586,37 @@ def _screen_agent_output(response_text: str) -> None:
     if not response_text:
         return
 
-    guardrails_llm_output_screen.invoke([HumanMessage(content=response_text)])
+    await guardrails_llm_output_screen.ainvoke([HumanMessage(content=response_text)])
     _trace_guardrails("output_screen")
 
 
 def make_guardrails_nodes() -> dict:
     """Create node functions that route LLM calls through the guardrails orchestrator."""
 
-    def g_supervisor_command_node(state: SupervisorState) -> Command:
+    async def g_supervisor_command_node(state: SupervisorState) -> Command:
         # Pre-screen user input before routing.
         try:
-            _screen_user_input(state["messages"])
+            await _screen_user_input(state["messages"])
         except Exception as exc:
             _trace_guardrails("input_screen")
-            print(f"[guardrails] User input blocked: {exc}", flush=True)
+            logger.info("[guardrails] User input blocked: %s", exc)
             return _guardrails_blocked_command()
 
         # Routing uses regular LLM (structured output, no guardrails).
-        decision: SupervisorDecision = llm.with_structured_output(
-            SupervisorDecision
-        ).invoke([SystemMessage(content=SUPERVISOR_PROMPT)] + state["messages"])
+        decision: SupervisorDecision = await _route_decision(state["messages"])
 
         if decision.next_agent == "none":
             try:
-                response = _invoke_agent(
-                    g_supervisor_agent, SUPERVISOR_PROMPT, state["messages"], "supervisor"
+                response = await _invoke_agent(
+                    g_supervisor_agent,
+                    _SUP_SYS,
+                    state["messages"],
+                    "supervisor",
+                    cache_scope="supervisor:fms",
                 )
             except Exception as exc:
                 _trace_guardrails("supervisor_response")
-                print(f"[guardrails] Supervisor response blocked: {exc}", flush=True)
+                logger.info("[guardrails] Supervisor response blocked: %s", exc)
                 return _guardrails_blocked_command()
             _trace_guardrails("supervisor_response")
             return Command(goto="__end__", update={"messages": [response]})
@@ -450,8 +628,8 @@ def make_guardrails_nodes() -> dict:
         }
         if decision.pizza_type != "":
             update["pizza_type"] = decision.pizza_type
-            print(f"Supervisor [guardrails]: Extracted pizza_type='{decision.pizza_type}'")
-        print(f"Supervisor [guardrails]: Routing to {decision.next_agent}")
+            logger.info("Supervisor [guardrails]: Extracted pizza_type=\'%s\'", decision.pizza_type)
+        logger.info("Supervisor [guardrails]: Routing to %s", decision.next_agent)
         return Command[str](goto=decision.next_agent, update=update)
 
     # Agent nodes use regular agents (with tools, regular LLM) because
@@ -459,42 +637,42 @@ def make_guardrails_nodes() -> dict:
     # role must be user, assistant, or system). User input is already
     # pre-screened before routing.
 
-    def g_pizza_agent_node(state: SupervisorState) -> Command:
-        print("Pizza Agent [guardrails]")
-        response = _invoke_agent(
-            pizza_agent, PIZZA_AGENT_PROMPT, state["messages"], "pizza_agent"
+    async def g_pizza_agent_node(state: SupervisorState) -> Command:
+        logger.info("Pizza Agent [guardrails]")
+        response = await _invoke_agent(
+            pizza_agent, _PIZZA_SYS, state["messages"], "pizza_agent"
         )
         try:
-            _screen_agent_output(normalize_content_to_text(response.content))
+            await _screen_agent_output(normalize_content_to_text(response.content))
         except Exception as exc:
             _trace_guardrails("output_screen")
-            print(f"[guardrails] Pizza agent output blocked: {exc}", flush=True)
+            logger.info("[guardrails] Pizza agent output blocked: %s", exc)
             return _guardrails_blocked_command()
         return Command[str](goto="wait_for_user_after_pizza", update={"messages": [response]})
 
-    def g_order_agent_node(state: SupervisorState) -> Command:
-        print("Order Agent [guardrails]")
-        response = _invoke_agent(
-            order_agent, ORDER_AGENT_PROMPT, state["messages"], "order_agent"
+    async def g_order_agent_node(state: SupervisorState) -> Command:
+        logger.info("Order Agent [guardrails]")
+        response = await _invoke_agent(
+            order_agent, _ORDER_SYS, state["messages"], "order_agent"
         )
         try:
-            _screen_agent_output(normalize_content_to_text(response.content))
+            await _screen_agent_output(normalize_content_to_text(response.content))
         except Exception as exc:
             _trace_guardrails("output_screen")
-            print(f"[guardrails] Order agent output blocked: {exc}", flush=True)
+            logger.info("[guardrails] Order agent output blocked: %s", exc)
             return _guardrails_blocked_command()
         return Command[str](goto="wait_for_user_after_order", update={"messages": [response]})
 
-    def g_delivery_agent_node(state: SupervisorState) -> Command:
-        print("Delivery Agent [guardrails]")
-        response = _invoke_agent(
-            delivery_agent, DELIVERY_AGENT_PROMPT, state["messages"], "delivery_agent"
+    async def g_delivery_agent_node(state: SupervisorState) -> Command:
+        logger.info("Delivery Agent [guardrails]")
+        response = await _invoke_agent(
+            delivery_agent, _DELIVERY_SYS, state["messages"], "delivery_agent"
         )
         try:
-            _screen_agent_output(normalize_content_to_text(response.content))
+            await _screen_agent_output(normalize_content_to_text(response.content))
         except Exception as exc:
             _trace_guardrails("output_screen")
-            print(f"[guardrails] Delivery agent output blocked: {exc}", flush=True)
+            logger.info("[guardrails] Delivery agent output blocked: %s", exc)
             return _guardrails_blocked_command()
         return Command[str](goto="wait_for_user_after_delivery", update={"messages": [response]})
 
@@ -509,7 +687,7 @@ def make_guardrails_nodes() -> dict:
 def make_nemo_guardrails_nodes() -> dict:
     """Create node functions that route through NeMo guardrails."""
 
-    def n_supervisor_command_node(state: SupervisorState) -> Command:
+    async def n_supervisor_command_node(state: SupervisorState) -> Command:
         # Pre-screen user input through NeMo.
         last_user_msg = None
         for m in reversed(state["messages"]):
@@ -518,23 +696,25 @@ def make_nemo_guardrails_nodes() -> dict:
                 break
         if last_user_msg:
             try:
-                _screen_nemo_input(last_user_msg)
+                await _screen_nemo_input(last_user_msg)
             except Exception as exc:
-                print(f"[nemo] User input blocked: {exc}", flush=True)
+                logger.info("[nemo] User input blocked: %s", exc)
                 return _guardrails_blocked_command()
 
         # Routing uses regular LLM.
-        decision: SupervisorDecision = llm.with_structured_output(
-            SupervisorDecision
-        ).invoke([SystemMessage(content=SUPERVISOR_PROMPT)] + state["messages"])
+        decision: SupervisorDecision = await _route_decision(state["messages"])
 
         if decision.next_agent == "none":
-            response = _invoke_agent(
-                nemo_supervisor_agent, SUPERVISOR_PROMPT, state["messages"], "supervisor"
+            response = await _invoke_agent(
+                nemo_supervisor_agent,
+                _SUP_SYS,
+                state["messages"],
+                "supervisor",
+                cache_scope="supervisor:nemo",
             )
             response_text = normalize_content_to_text(response.content)
             if _is_nemo_blocked(response_text):
-                print("[nemo] Supervisor response blocked", flush=True)
+                logger.info("[nemo] Supervisor response blocked")
                 return _guardrails_blocked_command()
             return Command(goto="__end__", update={"messages": [response]})
 
@@ -545,37 +725,37 @@ def make_nemo_guardrails_nodes() -> dict:
         }
         if decision.pizza_type != "":
             update["pizza_type"] = decision.pizza_type
-            print(f"Supervisor [nemo]: Extracted pizza_type='{decision.pizza_type}'")
-        print(f"Supervisor [nemo]: Routing to {decision.next_agent}")
+            logger.info("Supervisor [nemo]: Extracted pizza_type=\'%s\'", decision.pizza_type)
+        logger.info("Supervisor [nemo]: Routing to %s", decision.next_agent)
         return Command[str](goto=decision.next_agent, update=update)
 
-    def n_pizza_agent_node(state: SupervisorState) -> Command:
-        print("Pizza Agent [nemo]")
-        response = _invoke_agent(pizza_agent, PIZZA_AGENT_PROMPT, state["messages"], "pizza_agent")
+    async def n_pizza_agent_node(state: SupervisorState) -> Command:
+        logger.info("Pizza Agent [nemo]")
+        response = await _invoke_agent(pizza_agent, _PIZZA_SYS, state["messages"], "pizza_agent")
         try:
-            _screen_nemo_output(normalize_content_to_text(response.content))
+            await _screen_nemo_output(normalize_content_to_text(response.content))
         except Exception as exc:
-            print(f"[nemo] Pizza agent output blocked: {exc}", flush=True)
+            logger.info("[nemo] Pizza agent output blocked: %s", exc)
             return _guardrails_blocked_command()
         return Command[str](goto="wait_for_user_after_pizza", update={"messages": [response]})
 
-    def n_order_agent_node(state: SupervisorState) -> Command:
-        print("Order Agent [nemo]")
-        response = _invoke_agent(order_agent, ORDER_AGENT_PROMPT, state["messages"], "order_agent")
+    async def n_order_agent_node(state: SupervisorState) -> Command:
+        logger.info("Order Agent [nemo]")
+        response = await _invoke_agent(order_agent, _ORDER_SYS, state["messages"], "order_agent")
         try:
-            _screen_nemo_output(normalize_content_to_text(response.content))
+            await _screen_nemo_output(normalize_content_to_text(response.content))
         except Exception as exc:
-            print(f"[nemo] Order agent output blocked: {exc}", flush=True)
+            logger.info("[nemo] Order agent output blocked: %s", exc)
             return _guardrails_blocked_command()
         return Command[str](goto="wait_for_user_after_order", update={"messages": [response]})
 
-    def n_delivery_agent_node(state: SupervisorState) -> Command:
-        print("Delivery Agent [nemo]")
-        response = _invoke_agent(delivery_agent, DELIVERY_AGENT_PROMPT, state["messages"], "delivery_agent")
+    async def n_delivery_agent_node(state: SupervisorState) -> Command:
+        logger.info("Delivery Agent [nemo]")
+        response = await _invoke_agent(delivery_agent, _DELIVERY_SYS, state["messages"], "delivery_agent")
         try:
-            _screen_nemo_output(normalize_content_to_text(response.content))
+            await _screen_nemo_output(normalize_content_to_text(response.content))
         except Exception as exc:
-            print(f"[nemo] Delivery agent output blocked: {exc}", flush=True)
+            logger.info("[nemo] Delivery agent output blocked: %s", exc)
             return _guardrails_blocked_command()
         return Command[str](goto="wait_for_user_after_delivery", update={"messages": [response]})
 
@@ -590,13 +770,13 @@ def make_nemo_guardrails_nodes() -> dict:
 def make_both_guardrails_nodes() -> dict:
     """Create node functions that layer both FMS and NeMo guardrails."""
 
-    def b_supervisor_command_node(state: SupervisorState) -> Command:
+    async def b_supervisor_command_node(state: SupervisorState) -> Command:
         # FMS input screening.
         try:
-            _screen_user_input(state["messages"])
+            await _screen_user_input(state["messages"])
         except Exception as exc:
             _trace_guardrails("input_screen")
-            print(f"[guardrails/both] FMS input blocked: {exc}", flush=True)
+            logger.info("[guardrails/both] FMS input blocked: %s", exc)
             return _guardrails_blocked_command()
 
         # NeMo input screening.
@@ -607,25 +787,27 @@ def make_both_guardrails_nodes() -> dict:
                 break
         if last_user_msg:
             try:
-                _screen_nemo_input(last_user_msg)
+                await _screen_nemo_input(last_user_msg)
             except Exception as exc:
-                print(f"[guardrails/both] NeMo input blocked: {exc}", flush=True)
+                logger.info("[guardrails/both] NeMo input blocked: %s", exc)
                 return _guardrails_blocked_command()
 
         # Routing uses regular LLM.
-        decision: SupervisorDecision = llm.with_structured_output(
-            SupervisorDecision
-        ).invoke([SystemMessage(content=SUPERVISOR_PROMPT)] + state["messages"])
+        decision: SupervisorDecision = await _route_decision(state["messages"])
 
         if decision.next_agent == "none":
             # Route through FMS guardrails LLM for direct response.
             try:
-                response = _invoke_agent(
-                    g_supervisor_agent, SUPERVISOR_PROMPT, state["messages"], "supervisor"
+                response = await _invoke_agent(
+                    g_supervisor_agent,
+                    _SUP_SYS,
+                    state["messages"],
+                    "supervisor",
+                    cache_scope="supervisor:fms",
                 )
             except Exception as exc:
                 _trace_guardrails("supervisor_response")
-                print(f"[guardrails/both] FMS supervisor response blocked: {exc}", flush=True)
+                logger.info("[guardrails/both] FMS supervisor response blocked: %s", exc)
                 return _guardrails_blocked_command()
             _trace_guardrails("supervisor_response")
             return Command(goto="__end__", update={"messages": [response]})
@@ -637,58 +819,58 @@ def make_both_guardrails_nodes() -> dict:
         }
         if decision.pizza_type != "":
             update["pizza_type"] = decision.pizza_type
-            print(f"Supervisor [both]: Extracted pizza_type='{decision.pizza_type}'")
-        print(f"Supervisor [both]: Routing to {decision.next_agent}")
+            logger.info("Supervisor [both]: Extracted pizza_type=\'%s\'", decision.pizza_type)
+        logger.info("Supervisor [both]: Routing to %s", decision.next_agent)
         return Command[str](goto=decision.next_agent, update=update)
 
-    def b_pizza_agent_node(state: SupervisorState) -> Command:
-        print("Pizza Agent [both]")
-        response = _invoke_agent(pizza_agent, PIZZA_AGENT_PROMPT, state["messages"], "pizza_agent")
+    async def b_pizza_agent_node(state: SupervisorState) -> Command:
+        logger.info("Pizza Agent [both]")
+        response = await _invoke_agent(pizza_agent, _PIZZA_SYS, state["messages"], "pizza_agent")
         response_text = normalize_content_to_text(response.content)
         try:
-            _screen_agent_output(response_text)
+            await _screen_agent_output(response_text)
         except Exception as exc:
             _trace_guardrails("output_screen")
-            print(f"[guardrails/both] FMS pizza output blocked: {exc}", flush=True)
+            logger.info("[guardrails/both] FMS pizza output blocked: %s", exc)
             return _guardrails_blocked_command()
         try:
-            _screen_nemo_output(response_text)
+            await _screen_nemo_output(response_text)
         except Exception as exc:
-            print(f"[guardrails/both] NeMo pizza output blocked: {exc}", flush=True)
+            logger.info("[guardrails/both] NeMo pizza output blocked: %s", exc)
             return _guardrails_blocked_command()
         return Command[str](goto="wait_for_user_after_pizza", update={"messages": [response]})
 
-    def b_order_agent_node(state: SupervisorState) -> Command:
-        print("Order Agent [both]")
-        response = _invoke_agent(order_agent, ORDER_AGENT_PROMPT, state["messages"], "order_agent")
+    async def b_order_agent_node(state: SupervisorState) -> Command:
+        logger.info("Order Agent [both]")
+        response = await _invoke_agent(order_agent, _ORDER_SYS, state["messages"], "order_agent")
         response_text = normalize_content_to_text(response.content)
         try:
-            _screen_agent_output(response_text)
+            await _screen_agent_output(response_text)
         except Exception as exc:
             _trace_guardrails("output_screen")
-            print(f"[guardrails/both] FMS order output blocked: {exc}", flush=True)
+            logger.info("[guardrails/both] FMS order output blocked: %s", exc)
             return _guardrails_blocked_command()
         try:
-            _screen_nemo_output(response_text)
+            await _screen_nemo_output(response_text)
         except Exception as exc:
-            print(f"[guardrails/both] NeMo order output blocked: {exc}", flush=True)
+            logger.info("[guardrails/both] NeMo order output blocked: %s", exc)
             return _guardrails_blocked_command()
         return Command[str](goto="wait_for_user_after_order", update={"messages": [response]})
 
-    def b_delivery_agent_node(state: SupervisorState) -> Command:
-        print("Delivery Agent [both]")
-        response = _invoke_agent(delivery_agent, DELIVERY_AGENT_PROMPT, state["messages"], "delivery_agent")
+    async def b_delivery_agent_node(state: SupervisorState) -> Command:
+        logger.info("Delivery Agent [both]")
+        response = await _invoke_agent(delivery_agent, _DELIVERY_SYS, state["messages"], "delivery_agent")
         response_text = normalize_content_to_text(response.content)
         try:
-            _screen_agent_output(response_text)
+            await _screen_agent_output(response_text)
         except Exception as exc:
             _trace_guardrails("output_screen")
-            print(f"[guardrails/both] FMS delivery output blocked: {exc}", flush=True)
+            logger.info("[guardrails/both] FMS delivery output blocked: %s", exc)
             return _guardrails_blocked_command()
         try:
-            _screen_nemo_output(response_text)
+            await _screen_nemo_output(response_text)
         except Exception as exc:
-            print(f"[guardrails/both] NeMo delivery output blocked: {exc}", flush=True)
+            logger.info("[guardrails/both] NeMo delivery output blocked: %s", exc)
             return _guardrails_blocked_command()
         return Command[str](goto="wait_for_user_after_delivery", update={"messages": [response]})
 
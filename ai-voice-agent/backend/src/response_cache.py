@@ -0,0 +1,76 @@
+"""Persistent cache for full agent responses."""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+
+try:
+    import diskcache
+except Exception:  # pragma: no cover - optional persistent backend
+    diskcache = None
+
+logger = logging.getLogger(__name__)
+
+# Default under the system temp dir: the container runs as USER 1001
+# with a read-only /app, so a cwd-relative default would fail to
+# initialize there. Point RESPONSE_CACHE_DIR at a persistent volume to
+# survive restarts.
+RESPONSE_CACHE_DIR = os.getenv(
+    "RESPONSE_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "voice-agent-response-cache"),
+)
+
+
+class ResponseCache:
+    """LRU cache for agent reply text, persistent when diskcache is installed.
+
+    Many exchanges are deterministic ("hi" -> greeting, "what pizzas do
+    you have" -> the fixed menu), so replaying a previously seen
+    conversation state can skip the LLM round-trip entirely. Backed by
+    diskcache (survives restarts, LRU-evicted, capped at 1 GB) with an
+    in-process OrderedDict fallback when diskcache is unavailable.
+    """
+
+    def __init__(self, directory: str = RESPONSE_CACHE_DIR, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._mem: OrderedDict[str, str] = OrderedDict()
+        self._disk = None
+        if diskcache is not None:
+            try:
+                self._disk = diskcache.Cache(
+                    directory,
+                    size_limit=2**30,
+                    eviction_policy="least-recently-used",
+                )
+            except Exception as exc:  # pragma: no cover - disk unavailable
+                logger.warning("Disk cache unavailable, using memory only: %s", exc)
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response text for key, or None on a miss."""
+        if key in self._mem:
+            self._mem.move_to_end(key)
+            return self._mem[key]
+        if self._disk is not None:
+            value = self._disk.get(key)
+            if value is not None:
+                self._store_mem(key, value)
+                return value
+        return None
+
+    def put(self, key: str, value: str) -> None:
+        """Store a response text under key."""
+        self._store_mem(key, value)
+        if self._disk is not None:
+            try:
+                self._disk.set(key, value)
+            except Exception as exc:  # pragma: no cover - disk unavailable
+                logger.warning("Disk cache write failed: %s", exc)
+
+    def _store_mem(self, key: str, value: str) -> None:
+        self._mem[key] = value
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_entries:
+            self._mem.popitem(last=False)
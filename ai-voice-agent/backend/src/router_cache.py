@@ -0,0 +1,134 @@
+"""Semantic cache for supervisor routing decisions."""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import re
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+EMBEDDINGS_MODEL = os.getenv("EMBEDDINGS_MODEL", "")
+EMBEDDINGS_URL = os.getenv("EMBEDDINGS_URL", os.getenv("BASE_URL", ""))
+EMBEDDINGS_API_KEY = os.getenv("EMBEDDINGS_API_KEY", os.getenv("API_KEY", ""))
+
+_WS_RE = re.compile(r"\s+")
+
+# Common spoken-English contractions, expanded so "i'd like a pizza" and
+# "i would like a pizza" land on the same cache key.
+_CONTRACTIONS = {
+    "i'm": "i am",
+    "i'd": "i would",
+    "i'll": "i will",
+    "i've": "i have",
+    "it's": "it is",
+    "that's": "that is",
+    "what's": "what is",
+    "let's": "let us",
+    "don't": "do not",
+    "can't": "cannot",
+    "won't": "will not",
+    "didn't": "did not",
+    "doesn't": "does not",
+    "isn't": "is not",
+    "we're": "we are",
+    "we'll": "we will",
+    "you're": "you are",
+    "there's": "there is",
+}
+_CONTRACTIONS_RE = re.compile(
+    r"\b(" + "|".join(re.escape(c) for c in _CONTRACTIONS) + r")\b"
+)
+
+
+def normalize_query(text: str) -> str:
+    """Normalize a query for cache lookup.
+
+    Lowercases, collapses whitespace and expands common contractions so
+    trivially different phrasings share one exact-match key.
+    """
+    text = _WS_RE.sub(" ", text.strip().lower())
+    return _CONTRACTIONS_RE.sub(lambda m: _CONTRACTIONS[m.group(1)], text)
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class SemanticCache:
+    """In-process cache keyed by the user's last message.
+
+    Lookups hit an exact-match dict on the normalized text first. When an
+    embeddings model is configured (EMBEDDINGS_MODEL env var, pointed at an
+    OpenAI-compatible endpoint), near-matches fall back to cosine similarity
+    over stored embeddings so paraphrased utterances ("order a pizza" /
+    "I'd like to order a pizza") also skip the LLM round-trip.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 256):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._exact: dict[str, Any] = {}
+        self._entries: list[tuple[list[float], Any]] = []
+        self._embedder = None
+        if EMBEDDINGS_MODEL:
+            try:
+                from langchain_openai import OpenAIEmbeddings
+
+                self._embedder = OpenAIEmbeddings(
+                    model=EMBEDDINGS_MODEL,
+                    base_url=EMBEDDINGS_URL,
+                    api_key=EMBEDDINGS_API_KEY,
+                )
+            except Exception as exc:  # pragma: no cover - optional embedder
+                logger.warning("Embedder unavailable: %s", exc)
+
+    async def _embed(self, text: str) -> list[float] | None:
+        if self._embedder is None:
+            return None
+        try:
+            return await self._embedder.aembed_query(text)
+        except Exception as exc:
+            logger.warning("Embedding failed: %s", exc)
+            return None
+
+    async def get(self, query: str) -> Any | None:
+        """Return the cached value for query, or None on a miss."""
+        key = normalize_query(query)
+        if key in self._exact:
+            return self._exact[key]
+        embedding = await self._embed(key)
+        if embedding is None:
+            return None
+        best_score, best_value = 0.0, None
+        for stored_embedding, value in self._entries:
+            score = _cosine(embedding, stored_embedding)
+            if score > best_score:
+                best_score, best_value = score, value
+        if best_score >= self.threshold:
+            return best_value
+        return None
+
+    async def put(self, query: str, value: Any, embed: bool = True) -> None:
+        """Store a value under the query's normalized text (and embedding).
+
+        Pass embed=False for values that are only safe to serve on an
+        exact phrasing match — near-matches by cosine similarity would
+        conflate utterances that differ in exactly the part that matters
+        (e.g. which pizza was named).
+        """
+        key = normalize_query(query)
+        if len(self._exact) >= self.max_entries:
+            self._exact.pop(next(iter(self._exact)))
+        self._exact[key] = value
+        if not embed:
+            return
+        embedding = await self._embed(key)
+        if embedding is not None:
+            if len(self._entries) >= self.max_entries:
+                self._entries.pop(0)
+            self._entries.append((embedding, value))
@@ -6,25 +6,57 @@ This module provides specialized tools:
 - listen_for_user_speech: Capture microphone audio and transcribe it
 """
 
+import asyncio
 import base64
-import io
+import functools
+import gzip
+import logging
 import os
+import re
+import struct
+import threading
 import time
-import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterator
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter, Retry
 try:
     import simpleaudio as sa
 except Exception:  # pragma: no cover - optional audio backend
     sa = None
+try:
+    import sounddevice as sd
+except Exception:  # pragma: no cover - optional audio backend
+    sd = None
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except Exception:  # pragma: no cover - optional streaming encoder
+    MultipartEncoder = None
+try:
+    import pybase64
+except Exception:  # pragma: no cover - optional SIMD base64
+    pybase64 = None
+try:
+    import h2  # noqa: F401 - probe only; httpx needs it for http2=True
+    _HTTP2_AVAILABLE = True
+except Exception:  # pragma: no cover - optional HTTP/2 support
+    _HTTP2_AVAILABLE = False
+
+# pybase64 is API-compatible and several times faster on the large
+# audio buffers moved through here; fall back to the stdlib when absent.
+_b64encode = pybase64.b64encode if pybase64 else base64.b64encode
+_b64decode = pybase64.b64decode if pybase64 else base64.b64decode
 from dotenv import load_dotenv
 from langchain.tools import tool
 from openai import OpenAI
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 TTS_URL = os.getenv("TTS_URL", "TTS_URL")
 TTS_MODEL = os.getenv("TTS_MODEL", "TTS_MODEL")
 TTS_VOICE = os.getenv("TTS_VOICE", "TTS_VOICE")
@@ -35,47 +67,65 @@ TTS_API_KEY = os.getenv("TTS_API_KEY", os.getenv("API_KEY", ""))
 # A smaller default yields smoother realtime playback in the browser.
 TTS_AUDIO_CHUNK_SIZE = int(os.getenv("TTS_AUDIO_CHUNK_SIZE", "5"))
 TTS_TIMEOUT_S = float(os.getenv("TTS_TIMEOUT_S", "30"))
+# Longer replies are split on sentence boundaries and synthesized in
+# parallel; this caps the fan-out per reply.
+TTS_PARALLEL = int(os.getenv("TTS_PARALLEL", "4"))
 
 STT_URL = os.getenv("STT_URL", "STT_URL")
 STT_MODEL = os.getenv("STT_MODEL", "STT_MODEL")
 STT_TOKEN = os.getenv("STT_TOKEN", "STT_TOKEN")
 
+# One pooled session for all TTS/STT HTTP calls — reuses TCP (and TLS)
+# connections across turns instead of handshaking per request, with one
+# quick retry for transient connection drops.
+_HTTP = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=1, backoff_factor=0.1),
+)
+_HTTP.mount("http://", _http_adapter)
+_HTTP.mount("https://", _http_adapter)
+
+# Async counterpart of _HTTP for callers already on the event loop.
+_ASYNC_HTTP = httpx.AsyncClient(timeout=60)
+
 SAMPLE_RATE = 16000
 CHANNELS = 1
 SAMPLE_WIDTH = 2  # bytes (int16)
-_LISTENING_PAUSED = False
+# Event rather than a bare bool: atomic under concurrent sessions, and
+# callers can wait() on a transition instead of polling.
+_LISTENING_PAUSED = threading.Event()
 
 
 def pause_listening() -> None:
     """Signal to pause background listening callbacks."""
-    global _LISTENING_PAUSED
-    _LISTENING_PAUSED = True
-    print("Listening paused")
+    _LISTENING_PAUSED.set()
+    logger.debug("Listening paused")
 
 
 def resume_listening() -> None:
     """Signal to resume background listening callbacks."""
-    global _LISTENING_PAUSED
-    _LISTENING_PAUSED = False
-    print("Listening resumed")
+    _LISTENING_PAUSED.clear()
+    logger.debug("Listening resumed")
 
 
 def is_listening_paused() -> bool:
     """Return True if listening is currently paused."""
-    return _LISTENING_PAUSED
+    return _LISTENING_PAUSED.is_set()
 
 
 @tool
 def add_to_order(item: str) -> str:
     """Add an item to the customer's order."""
-    print("add_to_order tool called with item: ", item)
+    logger.debug("add_to_order tool called with item: %s", item)
     return f"Added {item} to the order."
 
 
 @tool
 def convert_text_to_speech(text: str = ""):
     """Convert text to speech and play the generated audio."""
-    print("convert_text_to_speech tool called with text: ", text)
+    logger.debug("convert_text_to_speech tool called with text: %s", text)
 
     if not text or not text.strip():
         # IMPORTANT: allow tool calls with missing args (LLM sometimes emits {}).
@@ -87,8 +137,8 @@ def convert_text_to_speech(text: str = ""):
         # We keep the tool callable but do not attempt to play.
         return "Audio playback disabled (PLAY_AUDIO=0)."
 
-    if sa is None:
-        return "Audio playback is unavailable because simpleaudio is not installed."
+    if sa is None and sd is None:
+        return "Audio playback is unavailable (neither sounddevice nor simpleaudio is installed)."
 
     pause_listening()
 
@@ -101,67 +151,262 @@ def convert_text_to_speech(text: str = ""):
     }
 
     try:
-        response = requests.post(url, json=payload, timeout=60)
+        response = _HTTP.post(url, json=payload, stream=True, timeout=60)
         response.raise_for_status()
     except requests.RequestException as exc:
         return f"Failed to generate audio: {exc}"
 
-    pcm_audio = response.content
-    if not pcm_audio:
-        return "No audio was returned from the service."
-
-    # simpleaudio expects raw PCM; ensure we have complete frames (2 bytes/sample).
-    if len(pcm_audio) % 2 != 0:
-        pcm_audio += b"\x00"
-
     try:
-        play_obj = sa.play_buffer(
-            pcm_audio, num_channels=1, bytes_per_sample=2, sample_rate=TTS_SAMPLE_RATE
-        )
-        play_obj.wait_done()
+        if sd is not None:
+            # Streamed playback: write chunks into an output stream as they
+            # arrive, so the first audio is heard while the tail is still
+            # being synthesized.
+            played = False
+            carry = b""
+            with sd.RawOutputStream(
+                samplerate=TTS_SAMPLE_RATE,
+                channels=1,
+                dtype="int16",
+                blocksize=1024,
+            ) as stream:
+                for chunk in response.iter_content(chunk_size=4096):
+                    if not chunk:
+                        continue
+                    chunk = carry + chunk
+                    # Only write whole int16 frames; carry any odd byte into
+                    # the next chunk.
+                    if len(chunk) % 2 != 0:
+                        carry = chunk[-1:]
+                        chunk = chunk[:-1]
+                    else:
+                        carry = b""
+                    if chunk:
+                        stream.write(chunk)
+                        played = True
+                # A trailing odd byte is half a sample — inaudible, drop it.
+            if not played:
+                return "No audio was returned from the service."
+        else:
+            # Fallback: simpleaudio has no incremental API, so buffer the
+            # streamed chunks and play once complete.
+            pcm_audio = b"".join(response.iter_content(chunk_size=4096))
+            if not pcm_audio:
+                return "No audio was returned from the service."
+            if len(pcm_audio) & 1:
+                # Drop the trailing half-sample rather than pad — padding
+                # reallocates and copies the whole buffer.
+                pcm_audio = memoryview(pcm_audio)[:-1].tobytes()
+            play_obj = sa.play_buffer(
+                pcm_audio, num_channels=1, bytes_per_sample=2, sample_rate=TTS_SAMPLE_RATE
+            )
+            play_obj.wait_done()
     except Exception as exc:
         return f"Failed to play audio: {exc}"
     finally:
-        time.sleep(0.75)  # Wait for the audio to finish playing
+        # Both playback paths block until the audio has drained (stream
+        # context exit / wait_done), so resume immediately.
         resume_listening()
 
     return "Played generated speech."
 
 
-def generate_tts_wav_b64(text: str) -> dict:
-    """Generate TTS audio as WAV (base64), suitable for returning to a browser."""
-    if not text or not text.strip():
-        return {"audio_b64": "", "format": "wav", "sample_rate": TTS_SAMPLE_RATE}
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
 
-    url = TTS_URL
-    payload = {
+
+def _split_sentences(text: str) -> list[str]:
+    """Split text into sentences for parallel synthesis."""
+    return [s for s in _SENTENCE_RE.split(text.strip()) if s]
+
+
+def _tts_payload_for(text: str) -> dict:
+    return {
         "model": TTS_MODEL,
         "voice": TTS_VOICE,
         "input": text,
         "response_format": "pcm",
     }
 
-    response = requests.post(url, json=payload, timeout=60)
+
+def _fetch_tts_pcm(text: str) -> bytes:
+    """Fetch raw PCM for one piece of text from the TTS endpoint."""
+    response = _HTTP.post(TTS_URL, json=_tts_payload_for(text), timeout=60)
     response.raise_for_status()
-    pcm_audio = response.content
-    if len(pcm_audio) % 2 != 0:
-        pcm_audio += b"\x00"
-
-    with io.BytesIO() as buf:
-        with wave.open(buf, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(TTS_SAMPLE_RATE)
-            wf.writeframes(pcm_audio)
-        wav_bytes = buf.getvalue()
+    return response.content
+
+
+def _wav_from_pcm(pcm_audio: bytes, sample_rate: int = TTS_SAMPLE_RATE) -> bytes:
+    """Prepend a 44-byte RIFF/WAVE header to mono int16 PCM.
+
+    Cheaper than routing the whole buffer through the wave module — the
+    header is a single struct.pack and the PCM is never copied through a
+    BytesIO.
+    """
+    byte_rate = sample_rate * 2  # mono, 2 bytes per sample
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + len(pcm_audio),
+        b"WAVE",
+        b"fmt ",
+        16,  # PCM fmt chunk size
+        1,  # audio format: PCM
+        1,  # channels
+        sample_rate,
+        byte_rate,
+        2,  # block align
+        16,  # bits per sample
+        b"data",
+        len(pcm_audio),
+    )
+    return header + pcm_audio
+
+
+def _pcm_to_wav_b64(pcm_audio: bytes) -> dict:
+    """Package raw PCM as a base64 WAV payload for the browser."""
+    if len(pcm_audio) & 1:
+        # Drop the trailing half-sample rather than pad — padding
+        # reallocates and copies the whole buffer.
+        pcm_audio = memoryview(pcm_audio)[:-1].tobytes()
+
+    return {
+        "audio_b64": _b64encode(_wav_from_pcm(pcm_audio)).decode("ascii"),
+        "format": "wav",
+        "sample_rate": TTS_SAMPLE_RATE,
+    }
+
+
+def generate_tts_wav_b64(text: str) -> dict:
+    """Generate TTS audio as WAV (base64), suitable for returning to a browser.
+
+    Multi-sentence replies are synthesized sentence-by-sentence in
+    parallel and the PCM joined in order — wall time approaches the
+    longest sentence rather than the sum.
+    """
+    if not text or not text.strip():
+        return {"audio_b64": "", "format": "wav", "sample_rate": TTS_SAMPLE_RATE}
+
+    sentences = _split_sentences(text)
+    if len(sentences) <= 1:
+        return _pcm_to_wav_b64(_fetch_tts_pcm(text))
+
+    with ThreadPoolExecutor(max_workers=min(len(sentences), TTS_PARALLEL)) as pool:
+        pcm_parts = list(pool.map(_fetch_tts_pcm, sentences))
+    return _pcm_to_wav_b64(b"".join(pcm_parts))
+
+
+async def _afetch_tts_pcm(text: str) -> bytes:
+    """Async counterpart of _fetch_tts_pcm."""
+    response = await _ASYNC_HTTP.post(TTS_URL, json=_tts_payload_for(text))
+    response.raise_for_status()
+    return response.content
+
+
+async def agenerate_tts_wav(text: str) -> bytes:
+    """Generate TTS audio as raw WAV bytes for event-loop callers.
+
+    Uses a shared httpx.AsyncClient so the WS server can await the TTS
+    round-trip directly instead of parking a worker thread on it.
+    Sentences are synthesized concurrently, mirroring the sync variant.
+    Returning bytes (not base64) lets the server ship the WAV as a
+    binary websocket frame with no encode/escape overhead.
+    """
+    if not text or not text.strip():
+        return b""
+
+    sentences = _split_sentences(text)
+    if len(sentences) <= 1:
+        pcm_audio = await _afetch_tts_pcm(text)
+    else:
+        pcm_parts = await asyncio.gather(*(_afetch_tts_pcm(s) for s in sentences))
+        pcm_audio = b"".join(pcm_parts)
+
+    if len(pcm_audio) & 1:
+        pcm_audio = memoryview(pcm_audio)[:-1].tobytes()
+    return _wav_from_pcm(pcm_audio)
 
+
+async def agenerate_tts_wav_b64(text: str) -> dict:
+    """Async variant of generate_tts_wav_b64 (base64 payload)."""
+    wav_bytes = await agenerate_tts_wav(text)
     return {
-        "audio_b64": base64.b64encode(wav_bytes).decode("ascii"),
+        "audio_b64": _b64encode(wav_bytes).decode("ascii") if wav_bytes else "",
         "format": "wav",
         "sample_rate": TTS_SAMPLE_RATE,
     }
 
 
+@functools.lru_cache(maxsize=1)
+def _get_openai_client() -> OpenAI:
+    """Shared OpenAI client for streamed TTS.
+
+    Constructing a client per call rebuilds the httpx transport and its
+    connection pool; one cached instance keeps connections to the TTS
+    endpoint alive across utterances.
+    """
+    http_client = httpx.Client(
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        timeout=httpx.Timeout(TTS_TIMEOUT_S, connect=2.0),
+    )
+    return OpenAI(
+        api_key=TTS_API_KEY or "fake",
+        base_url=TTS_URL,
+        timeout=TTS_TIMEOUT_S,
+        max_retries=1,
+        http_client=http_client,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _voice_clone_prefix(
+    wav_path: str, wav_mtime_ns: int, txt_path: str, txt_mtime_ns: int
+) -> tuple[dict, ...]:
+    """Build the (static) voice-clone conditioning messages, cached.
+
+    The prefix embeds the ~hundreds-of-KB reference base64; rebuilding
+    those dicts per utterance is wasted work, and a byte-identical
+    prefix also lets a prompt-hash cache on the serving side reuse its
+    prefill. Callers must append the varying user message and never
+    mutate the returned dicts.
+    """
+    audio_text, audio_b64 = _read_voice_bundle(
+        wav_path, wav_mtime_ns, txt_path, txt_mtime_ns
+    )
+    return (
+        {"role": "user", "content": audio_text},
+        {
+            "role": "assistant",
+            "content": [
+                {
+                    "type": "input_audio",
+                    "input_audio": {"data": audio_b64, "format": "wav"},
+                }
+            ],
+        },
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _read_voice_bundle(
+    wav_path: str, wav_mtime_ns: int, txt_path: str, txt_mtime_ns: int
+) -> tuple[str, str]:
+    """Read and base64-encode a voice-clone reference bundle, cached.
+
+    The reference WAV can run to hundreds of KB; re-reading and
+    re-encoding it per utterance is pure waste. Keyed on path + mtime so
+    an edited reference file invalidates its entry.
+    """
+    audio_text = Path(txt_path).read_text(encoding="utf-8", errors="replace")
+    # A pre-encoded sidecar (e.g. belinda.wav.b64, produced at deploy
+    # time) skips the runtime base64 encode entirely on first use.
+    sidecar = Path(wav_path + ".b64")
+    if sidecar.exists():
+        audio_b64 = sidecar.read_text(encoding="ascii").strip()
+    else:
+        audio_b64 = _b64encode(Path(wav_path).read_bytes()).decode("utf-8")
+    return audio_text, audio_b64
+
+
 def stream_tts_pcm_chunks(text: str) -> Iterator[bytes]:
     """Stream TTS audio as raw PCM int16 chunks (s16le).
 
@@ -178,21 +423,13 @@ def stream_tts_pcm_chunks(text: str) -> Iterator[bytes]:
 
     voice_mode = (TTS_VOICE or "").strip().lower()
 
-    def _encode_b64_file(p: Path) -> str:
-        return base64.b64encode(p.read_bytes()).decode("utf-8")
-
     # Voice cloning (Higgs): condition the chat with a reference audio + its transcript,
     # matching the pattern from `test-tts-stream.py`.
     use_voice_clone = voice_mode in {"belinda", "mike", "clone", "voice_clone"}
     voice_wav = Path(__file__).resolve().parents[1] / f"{TTS_VOICE}.wav"
     voice_txt = Path(__file__).resolve().parents[1] / f"{TTS_VOICE}.txt"
 
-    client = OpenAI(
-        api_key=TTS_API_KEY or "fake",
-        base_url=TTS_URL,
-        timeout=TTS_TIMEOUT_S,
-        max_retries=1,
-    )
+    client = _get_openai_client()
 
     if use_voice_clone:
         if not voice_wav.exists() or not voice_txt.exists():
@@ -200,21 +437,13 @@ def stream_tts_pcm_chunks(text: str) -> Iterator[bytes]:
                 f"Voice clone requested (TTS_VOICE={TTS_VOICE!r}) but files missing: "
                 f"{voice_wav} / {voice_txt}"
             )
-        audio_text = voice_txt.read_text(encoding="utf-8", errors="replace")
-        audio_b64 = _encode_b64_file(voice_wav)
-        messages = [
-            {"role": "user", "content": audio_text},
-            {
-                "role": "assistant",
-                "content": [
-                    {
-                        "type": "input_audio",
-                        "input_audio": {"data": audio_b64, "format": "wav"},
-                    }
-                ],
-            },
-            {"role": "user", "content": text},
-        ]
+        prefix = _voice_clone_prefix(
+            str(voice_wav),
+            voice_wav.stat().st_mtime_ns,
+            str(voice_txt),
+            voice_txt.stat().st_mtime_ns,
+        )
+        messages = [*prefix, {"role": "user", "content": text}]
     else:
         # Plain streamed TTS prompt (no voice conditioning).
         system_prompt = (
@@ -239,21 +468,77 @@ def stream_tts_pcm_chunks(text: str) -> Iterator[bytes]:
         stop=["<|eot_id|>", "<|end_of_text|>", "<|audio_eos|>"],
     )
 
+    # Coalesce small SSE chunks before handing them downstream: every
+    # yielded chunk becomes a queue op and a websocket send, so batching
+    # to ~8 KB (but never holding audio longer than 10 ms) cuts that
+    # per-chunk overhead 5-20x without adding audible latency.
+    pending = bytearray()
+    perf_counter = time.perf_counter
+    last_flush = perf_counter()
     for chunk in chat_completion:
-        if (
-            chunk.choices
-            and hasattr(chunk.choices[0].delta, "audio")
-            and chunk.choices[0].delta.audio
-        ):
-            audio_b64 = chunk.choices[0].delta.audio.get("data")
-            if audio_b64:
-                yield base64.b64decode(audio_b64)
+        # Bind the pydantic attribute chain once per chunk — repeated
+        # chunk.choices[0].delta.audio lookups are not free at the
+        # ~200 chunks/sec this loop sees with small audio_chunk_size.
+        choices = chunk.choices
+        if not choices:
+            continue
+        audio = getattr(choices[0].delta, "audio", None)
+        if not audio:
+            continue
+        audio_b64 = audio.get("data")
+        if not audio_b64:
+            continue
+        pending += _b64decode(audio_b64)
+        now = perf_counter()
+        if len(pending) >= 8192 or now - last_flush > 0.010:
+            yield bytes(pending)
+            pending.clear()
+            last_flush = now
+    if pending:
+        yield bytes(pending)
+
+
+def _post_stt(audio: bytes, headers: dict, compress: bool) -> requests.Response:
+    """POST audio to the STT endpoint, optionally gzip-compressing the body.
+
+    Speech WAV compresses roughly 2:1 (better on silence), so a cheap
+    compresslevel=1 pass halves upload time on constrained links.
+    Compression needs the whole multipart body as bytes (gzip of the
+    encoder output), so the compressed path buffers rather than streams;
+    the encoder only streams on the uncompressed path. Without the
+    encoder the raw files= path is used as before.
+    """
+    if MultipartEncoder is not None:
+        body = MultipartEncoder(
+            fields={
+                "file": ("audio.wav", audio, "audio/wav"),
+                "model": STT_MODEL,
+            }
+        )
+        post_headers = {**headers, "Content-Type": body.content_type}
+        data = body
+        if compress:
+            data = gzip.compress(body.to_string(), compresslevel=1)
+            post_headers["Content-Encoding"] = "gzip"
+        return _HTTP.post(STT_URL, headers=post_headers, data=data, timeout=60)
+
+    files = {
+        "file": ("audio.wav", audio, "audio/wav"),
+        "model": (None, STT_MODEL),
+    }
+    return _HTTP.post(STT_URL, headers=headers, files=files, timeout=60)
+
+
+# Cleared the first time the server rejects a gzip body so every later
+# transcription goes straight to the raw upload instead of paying a
+# doomed compressed attempt per call.
+_STT_GZIP_OK = True
 
 
 @tool
 def convert_speech_to_text(audio: bytes):
     """Convert speech (audio bytes) to text using the Whisper endpoint."""
-    print("convert_speech_to_text tool called ...")
+    logger.debug("convert_speech_to_text tool called ...")
 
     if not audio:
         return "No audio provided for speech-to-text."
@@ -265,13 +550,16 @@ def convert_speech_to_text(audio: bytes):
         if STT_TOKEN:
             headers["Authorization"] = f"Bearer {STT_TOKEN}"
 
-        files = {
-            "file": ("audio.wav", audio, "audio/wav"),
-            "model": (None, STT_MODEL),
-        }
-
+        global _STT_GZIP_OK
         try:
-            resp = requests.post(STT_URL, headers=headers, files=files, timeout=60)
+            resp = _post_stt(audio, headers, compress=_STT_GZIP_OK)
+            if _STT_GZIP_OK and resp.status_code in (400, 415):
+                # 400/415 on a gzip body plausibly means the server does
+                # not accept Content-Encoding: gzip — retry raw and stop
+                # compressing for the rest of the process. Other errors
+                # are not encoding-related and surface as-is.
+                _STT_GZIP_OK = False
+                resp = _post_stt(audio, headers, compress=False)
             resp.raise_for_status()
         except requests.RequestException as exc:
             return f"Failed to transcribe audio: {exc}"
@@ -291,33 +579,42 @@ def convert_speech_to_text(audio: bytes):
 
 
 
+# Shared ETA table; tools hand out copies so the entries stay pristine.
+# (Plain dicts, not MappingProxyType — tool returns must survive
+# json.dumps in the ToolNode serialization path.)
+_DELIVERY_ETAS = {
+    "delivery": {"estimated_delivery_time": "1 hour"},
+    "pickup": {"estimated_delivery_time": "30 minutes"},
+}
+_DEFAULT_ETA = _DELIVERY_ETAS["delivery"]
+
+
 @tool
 def choose_delivery(delivery_option: str) -> dict:
     """Choose a delivery option."""
-    if delivery_option == "delivery":
-        estimated_delivery_time = "1 hour"
-    elif delivery_option == "pickup":
-        estimated_delivery_time = "30 minutes"
-    else:
-        estimated_delivery_time = "1 hour"
-
-    result = {"estimated_delivery_time": estimated_delivery_time}
-    print(
-        f"choose_delivery   → {result['estimated_delivery_time']} estimated delivery time"
+    result = _DELIVERY_ETAS.get(delivery_option, _DEFAULT_ETA)
+    logger.debug(
+        "choose_delivery   → %s estimated delivery time",
+        result["estimated_delivery_time"],
     )
-    return result
+    return dict(result)
+
+
+# Built once; tools hand out copies so the shared menu stays pristine.
+# (Plain dict, not MappingProxyType — tool returns must survive
+# json.dumps in the ToolNode serialization path.)
+_PIZZA_TYPES = {
+    "margherita": "Margherita",
+    "pepperoni": "Pepperoni",
+    "vegetarian": "Vegetarian",
+    "hawaiian": "Hawaiian",
+    "meatlovers": "Meat Lovers",
+    "bbq_chicken": "BBQ Chicken",
+    "spinach_and_mushroom": "Spinach and Mushroom",
+}
 
 
 @tool
 def get_pizza_type(query: str) -> dict:
     """Supported pizza types."""
-    pizza_type_dictionary = {
-        "margherita": "Margherita",
-        "pepperoni": "Pepperoni",
-        "vegetarian": "Vegetarian",
-        "hawaiian": "Hawaiian",
-        "meatlovers": "Meat Lovers",
-        "bbq_chicken": "BBQ Chicken",
-        "spinach_and_mushroom": "Spinach and Mushroom",
-    }
-    return pizza_type_dictionary
+    return dict(_PIZZA_TYPES)
@@ -2,6 +2,7 @@
 """WebSocket server for browser audio -> STT -> agent graph.
 
 Protocol (client -> server):
+  - Binary frame: raw WAV bytes (fast path, no base64/JSON overhead)
   - JSON text message:
       {"type":"audio_wav_b64","audio_b64":"...base64..."}
       {"type":"text","text":"..."}
@@ -14,23 +15,37 @@ Protocol (server -> client):
       {"type":"tts_begin","format":"pcm_s16le","sample_rate":24000}
       # After tts_begin, server streams raw binary websocket frames containing pcm_s16le bytes.
       {"type":"tts_end"}
+      {"type":"tts_error","error":"..."}  # reports failure AND ends the stream
       # (fallback)
-      {"type":"tts_audio","format":"wav","sample_rate":24000,"audio_b64":"..."}
+      {"type":"tts_audio","format":"wav","sample_rate":24000,"len":N}
+      # followed by ONE binary websocket frame containing the N WAV bytes
       {"type":"error","error":"..."}
 """
 
 import asyncio
 import base64
+import hashlib
 import json
 import logging
 import os
 import re
+import secrets
 import signal
+import sys
 import threading
-import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import websockets
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional fast JSON
+    orjson = None
+try:
+    import pybase64
+except Exception:  # pragma: no cover - optional SIMD base64
+    pybase64 = None
 from langchain_core.globals import set_debug
 from langchain_core.messages import HumanMessage
 from langgraph.types import Command
@@ -39,17 +54,69 @@ from websockets.exceptions import ConnectionClosed
 # Suppress noisy "opening handshake failed" from k8s tcpSocket probes
 logging.getLogger("websockets").setLevel(logging.CRITICAL)
 
+logger = logging.getLogger(__name__)
+
 from src.content_utils import normalize_content_to_text
 from src.graph import build_graph
+from src.logging_utils import setup_queue_logging
 from src.nodes import GUARDRAILS_URL, NEMO_GUARDRAILS_URL
 from src.tools import (
     TTS_SAMPLE_RATE,
+    agenerate_tts_wav,
     convert_speech_to_text,
-    generate_tts_wav_b64,
     stream_tts_pcm_chunks,
 )
 
-set_debug(True)
+# LangChain debug mode serializes every message and intermediate step to
+# stdout on each graph turn — useful for tracing, costly in production.
+if os.getenv("LC_DEBUG") == "1":
+    set_debug(True)
+setup_queue_logging()
+
+# SIMD base64 decode matters here: inbound voice clips can run to megabytes.
+_b64decode = pybase64.b64decode if pybase64 else base64.b64decode
+
+# Unwrap the tool once at import; the handler calls the plain function.
+_stt = convert_speech_to_text.func
+
+
+def _decode_and_stt(audio_b64: str) -> str:
+    """Base64-decode and transcribe in a single worker-thread hop.
+
+    Decoding tens-to-hundreds of KB of base64 on the event loop stalls
+    every other connection's frame delivery; doing it alongside the STT
+    call keeps the loop to framing only.
+    """
+    return _stt(_b64decode(audio_b64))
+
+# orjson serializes in C straight to bytes; the .decode() keeps frames
+# textual on the wire, which the frontend relies on to tell JSON from
+# binary PCM frames.
+if orjson is not None:
+    _orjson_dumps = orjson.dumps
+
+    def _dumps(obj) -> str:
+        return _orjson_dumps(obj).decode()
+
+    _loads = orjson.loads
+else:  # pragma: no cover - stdlib fallback
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Protocol strings appear as dict keys/values in every frame we build or
+# parse; interning them keeps one shared object per string so dict key
+# hashing takes the pointer-equality fast path even for keys decoded
+# from the wire.
+for _key in (
+    "type", "text", "error", "mode", "enabled", "delta",
+    "transcript", "graph_result", "pizza_type", "messages", "interrupt",
+    "role", "content", "audio_b64", "audio_wav_b64",
+    "tts_begin", "tts_end", "tts_error", "tts_audio", "tts_text",
+    "format", "sample_rate", "pcm_s16le", "wav", "len",
+    "batch", "frames",
+):
+    sys.intern(_key)
+del _key
 
 # ─── Optional MLflow tracing ────────────────────────────────────────────────
 _mlflow_uri = os.environ.get("MLFLOW_TRACKING_URI", "").strip()
@@ -63,9 +130,9 @@ if _mlflow_uri:
         experiment_name = os.environ.get("MLFLOW_EXPERIMENT_NAME", "ai-voice-agent")
         mlflow.set_experiment(experiment_name)
         _mlflow_enabled = True
-        print(f"[mlflow] Tracing enabled → {_mlflow_uri}  experiment={experiment_name}", flush=True)
+        logger.info("[mlflow] Tracing enabled → %s  experiment=%s", _mlflow_uri, experiment_name)
     except Exception as exc:
-        print(f"[mlflow] Failed to initialise tracing (continuing without): {exc}", flush=True)
+        logger.warning("[mlflow] Failed to initialise tracing (continuing without): %s", exc)
 
 
 def _mlflow_callbacks() -> list:
@@ -78,18 +145,36 @@ def _mlflow_callbacks() -> list:
         return []
 
 
-def _safe_messages(result: dict) -> list[dict[str, str]]:
-    msgs = []
-    for m in result.get("messages", []):
-        content = normalize_content_to_text(getattr(m, "content", str(m)))
-        msgs.append(
-            {
-                "role": getattr(m, "name", None) or getattr(m, "type", "message"),
-                "content": content,
-            }
-        )
-    return msgs
+def _safe_messages(messages: list) -> list[dict[str, str]]:
+    """Serialize messages for the client (callers pass only unsent ones)."""
+    return [
+        {
+            "role": getattr(m, "name", None) or getattr(m, "type", "message"),
+            "content": normalize_content_to_text(getattr(m, "content", None) or str(m)),
+        }
+        for m in messages
+    ]
+
+
+# Caps concurrent inference work (graph turns, STT, TTS synthesis) so a
+# burst of clients queues here instead of thrashing the model servers.
+# Default of 4 (not 1) because inference is remote HTTP in this app —
+# the serving side batches; we only bound the fan-out.
+INFERENCE_SEM = asyncio.Semaphore(int(os.getenv("INFERENCE_CONCURRENCY", "4")))
+
+# Dedicated executor for blocking inference calls. asyncio's default
+# pool allows min(32, cpu+4) workers — far more blocking HTTP calls in
+# flight than the semaphore above intends to admit.
+INFER_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("INFER_WORKERS", "2")), thread_name_prefix="infer"
+)
 
+# Reusable pool for TTS stream producers: spawning a fresh thread per
+# utterance costs a pthread_create + stack allocation every turn, and on
+# the default executor a long TTS pull can sit behind unrelated work.
+_TTS_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("TTS_WORKERS", "2")), thread_name_prefix="tts"
+)
 
 GRAPH = build_graph(mode="none")
 GRAPH_FMS = build_graph(mode="fms") if GUARDRAILS_URL else None
@@ -104,7 +189,7 @@ def _interrupt_values(result: dict) -> list[Any]:
     return values
 
 
-_TTS_CALL_RE = re.compile(r'convert_text_to_speech\(.*?text\s*=\s*"(.*?)".*?\)')
+_TTS_CALL_RE = re.compile(r'convert_text_to_speech\(.*?text\s*=\s*"(.*?)"', re.DOTALL)
 
 
 def _select_tts_text(result: dict) -> str:
@@ -112,23 +197,30 @@ def _select_tts_text(result: dict) -> str:
     ints = _interrupt_values(result)
     if ints and isinstance(ints[0], dict):
         prompt = normalize_content_to_text(ints[0].get("prompt") or "")
-        m = _TTS_CALL_RE.search(prompt)
-        if m:
-            return m.group(1).strip()
+        # Cheap substring probe first — almost no prompts embed a tool
+        # call, and `in` is a C-level scan vs the backtracking regex.
+        if "convert_text_to_speech(" in prompt:
+            m = _TTS_CALL_RE.search(prompt)
+            if m:
+                return m.group(1).strip()
         return prompt
 
     for m in reversed(result.get("messages", []) or []):
+        # Cheap skips first: role check and raw-falsy check cost a couple
+        # of attribute lookups vs normalizing every message's content.
         role = getattr(m, "name", None) or getattr(m, "type", "")
-        content = normalize_content_to_text(getattr(m, "content", "") or "")
-        if not content:
+        if role == "human":
             continue
-        if content.startswith("Routing to"):
+        raw = getattr(m, "content", "") or ""
+        if not raw:
             continue
-        if role == "human":
+        content = normalize_content_to_text(raw)
+        if not content or content.startswith("Routing to"):
             continue
-        mm = _TTS_CALL_RE.search(content)
-        if mm:
-            return mm.group(1).strip()
+        if "convert_text_to_speech(" in content:
+            mm = _TTS_CALL_RE.search(content)
+            if mm:
+                return mm.group(1).strip()
         return content
     return ""
 
@@ -142,25 +234,132 @@ _GRAPHS = {
 
 
 async def _invoke_graph(inputs: Any, config: dict, mode: str = "none") -> dict:
-    """Invoke graph in a thread to avoid blocking the WS event loop."""
+    """Invoke graph asynchronously so LLM I/O overlaps with the WS event loop."""
     callbacks = _mlflow_callbacks()
     if callbacks:
         config = {**config, "callbacks": callbacks}
     graph = _GRAPHS.get(mode) or GRAPH
-    return await asyncio.to_thread(graph.invoke, inputs, config)
+    async with INFERENCE_SEM:
+        return await graph.ainvoke(inputs, config)
+
+
+# Canned phrases (confirmation prompts, routing questions) recur across
+# turns and sessions; caching the synthesized WAV skips the whole TTS
+# round-trip on repeats.
+# Repeated utterances within a session (users retrying a phrase) replay
+# the previous turn's graph_result and speech instead of re-running the
+# multi-second LLM turn. Keys include the per-connection thread id, so
+# hits never cross sessions; only completed non-interrupt turns are
+# stored. Single event loop — no lock needed.
+_TURN_CACHE: OrderedDict[tuple[str, str, str], tuple[str, list, str]] = OrderedDict()
+_TURN_CACHE_MAX = 256
+
+_TTS_CACHE: OrderedDict[str, bytes] = OrderedDict()
+_TTS_CACHE_MAX = 128
+_TTS_CACHE_LOCK = asyncio.Lock()
+
+
+async def _cached_tts_wav(text: str) -> bytes:
+    """Synthesize text to WAV bytes through a small LRU cache."""
+    key = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    async with _TTS_CACHE_LOCK:
+        if key in _TTS_CACHE:
+            _TTS_CACHE.move_to_end(key)
+            return _TTS_CACHE[key]
+    async with INFERENCE_SEM:
+        wav_bytes = await agenerate_tts_wav(text)
+    if wav_bytes:
+        async with _TTS_CACHE_LOCK:
+            _TTS_CACHE[key] = wav_bytes
+            _TTS_CACHE.move_to_end(key)
+            while len(_TTS_CACHE) > _TTS_CACHE_MAX:
+                _TTS_CACHE.popitem(last=False)
+    return wav_bytes
+
+
+async def _send_tts_wav(ws, text: str) -> None:
+    """Fallback TTS: send one WAV as a small JSON header plus a binary frame.
+
+    Skips the base64 encode and JSON string-escape a b64-in-JSON payload
+    would cost (and the 33% wire inflation) for MB-scale audio.
+    """
+    wav_bytes = await _cached_tts_wav(text)
+    if not wav_bytes:
+        return
+    await ws.send(
+        _dumps(
+            {
+                "type": "tts_audio",
+                "format": "wav",
+                "sample_rate": TTS_SAMPLE_RATE,
+                "len": len(wav_bytes),
+            }
+        )
+    )
+    await ws.send(wav_bytes)
+
 
+def _human_message(text: str) -> HumanMessage:
+    """Build a HumanMessage without running Pydantic validation.
 
-async def _tts_payload(text: str) -> dict:
-    """Generate TTS payload without blocking the WS event loop."""
-    return await asyncio.to_thread(generate_tts_wav_b64, text)
+    The content is always a plain str here, so model_construct's
+    skip-validation path is safe and several times cheaper per turn.
+    """
+    return HumanMessage.model_construct(content=text, type="human")
 
 
-async def _tts_stream(ws, text: str) -> None:
-    """Stream TTS PCM audio chunks to the client over WS."""
-    if not text or not text.strip():
+def _batch_frames(frames: list[dict]) -> str:
+    """Serialize frames as one wire message (batch envelope when > 1)."""
+    if len(frames) == 1:
+        return _dumps(frames[0])
+    return _dumps({"type": "batch", "frames": frames})
+
+
+# Fixed stream-control frames, built once at import. tts_begin stays a
+# dict because it is batched with per-turn prelude frames; tts_end is
+# sent alone, so it is pre-serialized.
+_TTS_BEGIN_FRAME = {
+    "type": "tts_begin",
+    "format": "pcm_s16le",
+    "sample_rate": TTS_SAMPLE_RATE,
+}
+_TTS_END_MSG = _dumps({"type": "tts_end"})
+
+# Outbound PCM framing, fixed for the life of the process: WS_TTS_CHUNK_MS
+# of s16le mono per frame (default 20 ms; the *2 sample width keeps the
+# byte count even).
+_WS_CHUNK_MS = int(os.getenv("WS_TTS_CHUNK_MS", "20"))
+_WS_CHUNK_BYTES = max(1, int(TTS_SAMPLE_RATE * _WS_CHUNK_MS / 1000)) * 2
+
+
+async def _tts_stream(ws, text: str, prelude: list[dict] | None = None) -> None:
+    """Stream TTS PCM audio chunks to the client over WS.
+
+    Any prelude frames (e.g. graph_result) are coalesced with tts_begin
+    into a single websocket send — one syscall/TLS record instead of
+    two back-to-back small writes.
+    """
+    frames = list(prelude) if prelude else []
+    # Callers pass already-stripped text (_select_tts_text output or the
+    # stripped tts_text payload), so a falsy check is enough: no-speech
+    # turns send only the prelude and skip the tts_begin/end round-trip.
+    if not text:
+        if frames:
+            await ws.send(_batch_frames(frames))
         return
     loop = asyncio.get_running_loop()
-    q: asyncio.Queue[bytes | None] = asyncio.Queue()
+    # Bounded so a slow browser throttles the producer instead of PCM
+    # piling up in Python memory; worst case is ~maxsize chunks per
+    # connection.
+    q: asyncio.Queue[bytes | None] = asyncio.Queue(
+        maxsize=int(os.getenv("WS_TTS_QUEUE", "8"))
+    )
+
+    # Set when the consumer is gone (send failure / disconnect); the
+    # producer checks it so it never sits blocked on a queue nobody
+    # drains — with only TTS_WORKERS producer threads, an abandoned
+    # stream would otherwise stall TTS for every other connection.
+    abandoned = threading.Event()
 
     # Even if the upstream TTS stream yields large bursts, we re-chunk to small WS frames
     # to reduce browser-side jitter/underruns.
@@ -169,187 +368,279 @@ async def _tts_stream(ws, text: str) -> None:
             for chunk in stream_tts_pcm_chunks(text):
                 if not chunk:
                     continue
-                loop.call_soon_threadsafe(q.put_nowait, chunk)
+                if abandoned.is_set():
+                    return
+                # Blocks the producer thread when the queue is full,
+                # propagating backpressure into the upstream TTS read.
+                asyncio.run_coroutine_threadsafe(q.put(chunk), loop).result(
+                    timeout=30
+                )
         finally:
-            loop.call_soon_threadsafe(q.put_nowait, None)
+            if not abandoned.is_set():
+                # put (not put_nowait): the sentinel must queue behind any
+                # buffered chunks even when the queue is momentarily full.
+                asyncio.run_coroutine_threadsafe(q.put(None), loop)
 
-    await ws.send(
-        json.dumps({"type": "tts_begin", "format": "pcm_s16le", "sample_rate": TTS_SAMPLE_RATE})
-    )
+    frames.append(_TTS_BEGIN_FRAME)
+    await ws.send(_batch_frames(frames))
     # Run the producer in a thread WITHOUT awaiting it so the consumer loop
     # below can send chunks to the browser as they arrive (true streaming).
-    loop.run_in_executor(None, _producer)
+    loop.run_in_executor(_TTS_POOL, _producer)
 
     buffered = bytearray()
-    while True:
-        chunk = await q.get()
-        if chunk is None:
-            break
-        buffered.extend(chunk)
-        # Send in 20ms frames (s16le, mono).
-        frame_bytes = int(TTS_SAMPLE_RATE * 0.02) * 2
-        while len(buffered) >= frame_bytes:
-            frame = bytes(buffered[:frame_bytes])
-            del buffered[:frame_bytes]
-            await ws.send(frame)
-
-    # Send remaining bytes (if any).
-    if buffered:
-        await ws.send(bytes(buffered))
-
-    await ws.send(json.dumps({"type": "tts_end"}))
+    try:
+        while True:
+            chunk = await q.get()
+            if chunk is None:
+                break
+            buffered.extend(chunk)
+            sendable = len(buffered) - len(buffered) % _WS_CHUNK_BYTES
+            if not sendable:
+                continue
+            # Slice a memoryview instead of copying each frame out with
+            # bytes(): websockets copies bytes-like payloads into the frame
+            # on send anyway, so the per-chunk bytes() was pure allocator
+            # churn. The view must be released before del can shrink the
+            # bytearray. Once a backlog has built up the pacing is lost
+            # anyway, so coalesce up to 4 frames per send — the per-send
+            # overhead (framing + syscall + drain) dominates at 20 ms
+            # granularity, and the browser buffers PCM regardless of chunk
+            # size.
+            mv = memoryview(buffered)
+            try:
+                step = _WS_CHUNK_BYTES * 4
+                for i in range(0, sendable, step):
+                    await ws.send(mv[i : min(i + step, sendable)])
+            finally:
+                mv.release()
+            del buffered[:sendable]
+
+        # Send remaining bytes (if any). The bytearray is bytes-like and
+        # is not touched again, so no defensive copy is needed.
+        if buffered:
+            await ws.send(buffered)
+
+        await ws.send(_TTS_END_MSG)
+    except BaseException:
+        # Flag first, then free a queue slot so a producer blocked in
+        # q.put wakes, sees the flag, and exits without the sentinel.
+        abandoned.set()
+        while not q.empty():
+            q.get_nowait()
+        raise
+
+
+# Constant frames serialized once — the error paths then cost a single
+# send with no per-call json work or garbage.
+_ERR_NO_AUDIO = _dumps({"type": "error", "error": "No audio provided"})
+_ERR_NO_TEXT = _dumps({"type": "error", "error": "No text provided"})
+_ERR_TIMEOUT = _dumps(
+    {
+        "type": "error",
+        "error": "Graph invoke timed out (45s). Check MODEL_NAME/BASE_URL/API_KEY connectivity.",
+    }
+)
 
 
 async def handler(ws) -> None:
     awaiting_resume = False
     guardrails_mode = "none"
-    config = {"configurable": {"thread_id": str(uuid.uuid4())}}
+    # Messages already shipped to this client; later graph_results send
+    # only the tail as a delta instead of re-serializing the whole
+    # (growing) history every turn.
+    sent_msg_count = 0
+    # token_hex(8) is plenty of entropy for a per-process conversation id
+    # and about half the cost of formatting a full uuid4.
+    thread_id = f"ws-{secrets.token_hex(8)}"
+    config = {"configurable": {"thread_id": thread_id}}
+    # Bounded queue between the recv loop and the turn worker: the next
+    # message is received, parsed and base64-decoded while the current
+    # turn is still in STT/graph/TTS. Turns stay strictly FIFO (single
+    # worker); the small bound gives backpressure instead of buffering
+    # an unbounded backlog from a fast client.
+    jobs: asyncio.Queue = asyncio.Queue(maxsize=int(os.getenv("WS_JOB_QUEUE", "4")))
+
+    async def _graph_turn(text: str, timeout: float | None = None) -> None:
+        """Run one graph turn for `text` and stream the spoken response."""
+        nonlocal awaiting_resume, sent_msg_count
+        was_resume = awaiting_resume
+        # guardrails_mode is part of the key: a turn completed with
+        # guardrails off must not be replayed (unscreened) after the
+        # user toggles them on, and vice versa.
+        cache_key = (thread_id, guardrails_mode, text)
+        if not was_resume:
+            cached = _TURN_CACHE.get(cache_key)
+            if cached is not None:
+                # Replaying skips the graph entirely, so the checkpointer
+                # and sent_msg_count stay untouched and consistent — the
+                # repeated exchange just never enters the LLM history.
+                _TURN_CACHE.move_to_end(cache_key)
+                pizza_type, tail_msgs, speak_text = cached
+                graph_frame = {
+                    "type": "graph_result",
+                    "pizza_type": pizza_type,
+                    "messages": tail_msgs,
+                    "delta": sent_msg_count > 0,
+                    "interrupt": None,
+                }
+                await _tts_stream(ws, speak_text, prelude=[graph_frame])
+                return
+        inputs = (
+            Command(resume=text)
+            if was_resume
+            else {"messages": [_human_message(text)]}
+        )
+        try:
+            # asyncio.timeout cancels in place; wait_for would wrap the
+            # invoke in an extra Task per turn. timeout=None disables it.
+            async with asyncio.timeout(timeout):
+                result = await _invoke_graph(inputs, config, mode=guardrails_mode)
+        except TimeoutError:
+            await ws.send(_ERR_TIMEOUT)
+            return
+        interrupt_values = _interrupt_values(result)
+        awaiting_resume = bool(interrupt_values)
+        all_msgs = result.get("messages", [])
+        graph_frame = {
+            "type": "graph_result",
+            "pizza_type": result.get("pizza_type", ""),
+            "messages": _safe_messages(all_msgs[sent_msg_count:]),
+            "delta": sent_msg_count > 0,
+            "interrupt": interrupt_values[0] if interrupt_values else None,
+        }
+        sent_msg_count = len(all_msgs)
+        speak_text = _select_tts_text(result)
+        # Only plain completed turns are safe to replay: resume turns
+        # depend on interrupt state and interrupted turns change it.
+        if not was_resume and not interrupt_values:
+            _TURN_CACHE[cache_key] = (
+                graph_frame["pizza_type"],
+                graph_frame["messages"],
+                speak_text,
+            )
+            while len(_TURN_CACHE) > _TURN_CACHE_MAX:
+                _TURN_CACHE.popitem(last=False)
+        try:
+            await _tts_stream(ws, speak_text, prelude=[graph_frame])
+        except Exception as exc:
+            # Fallback: single WAV blob. Don't resend graph_frame: the
+            # client appends delta messages, so a resend would duplicate
+            # the turn in the chat — and the batched prelude send either
+            # already succeeded or the connection is gone.
+            try:
+                await _send_tts_wav(ws, speak_text)
+            except Exception:
+                # tts_error both reports the failure and ends the stream
+                # client-side — one frame instead of error + tts_end.
+                await ws.send(
+                    _dumps({"type": "tts_error", "error": f"TTS failed: {exc}"})
+                )
+
+    async def _audio_turn(audio, stt=_stt) -> None:
+        """STT the audio, echo the transcript, then run the graph turn."""
+        loop = asyncio.get_running_loop()
+        async with INFERENCE_SEM:
+            text = await loop.run_in_executor(INFER_POOL, stt, audio)
+        await ws.send(_dumps({"type": "transcript", "text": text}))
+        await _graph_turn(text)
+
+    async def _tts_turn(speak_text: str) -> None:
+        """Debug / testing endpoint: stream TTS directly without the graph."""
+        try:
+            await _tts_stream(ws, speak_text)
+        except Exception as exc:
+            await ws.send(
+                _dumps({"type": "tts_error", "error": f"TTS stream failed: {exc}"})
+            )
+
+    async def _worker() -> None:
+        while True:
+            kind, payload = await jobs.get()
+            try:
+                if kind == "audio":
+                    await _audio_turn(payload)
+                elif kind == "audio_b64":
+                    await _audio_turn(payload, stt=_decode_and_stt)
+                elif kind == "text":
+                    await _graph_turn(payload, timeout=45)
+                else:
+                    await _tts_turn(payload)
+            except ConnectionClosed:
+                return
+            except Exception as exc:
+                logger.exception("[ws] error: %s", exc)
+                try:
+                    await ws.send(_dumps({"type": "error", "error": str(exc)}))
+                except ConnectionClosed:
+                    return
+
+    worker = asyncio.create_task(_worker())
     # Tell the client which guardrails backends are available.
-    await ws.send(json.dumps({
+    await ws.send(_dumps({
         "type": "guardrails_available",
         "available": bool(GUARDRAILS_URL),
         "fms_guardrails_available": bool(GUARDRAILS_URL),
         "nemo_guardrails_available": bool(NEMO_GUARDRAILS_URL),
     }))
-    while True:
-        try:
-            raw = await ws.recv()
-            if isinstance(raw, bytes):
-                # Ignore binary frames from client (not supported).
-                continue
-            data = json.loads(raw)
-            msg_type = data.get("type")
-            if msg_type == "audio_wav_b64":
-                b64 = data.get("audio_b64") or ""
-                if not b64:
-                    await ws.send(json.dumps({"type": "error", "error": "No audio provided"}))
-                    continue
-                audio = base64.b64decode(b64)
-                text = convert_speech_to_text.invoke({"audio": audio})
-                await ws.send(json.dumps({"type": "transcript", "text": text}))
-                inputs = (
-                    Command(resume=text)
-                    if awaiting_resume
-                    else {"messages": [HumanMessage(content=text)]}
-                )
-                result = await _invoke_graph(inputs, config, mode=guardrails_mode)
-                interrupt_values = _interrupt_values(result)
-                awaiting_resume = bool(interrupt_values)
-                await ws.send(
-                    json.dumps(
-                        {
-                            "type": "graph_result",
-                            "pizza_type": result.get("pizza_type", ""),
-                            "messages": _safe_messages(result),
-                            "interrupt": interrupt_values[0] if interrupt_values else None,
-                        }
-                    )
-                )
-                speak_text = _select_tts_text(result)
-                try:
-                    await _tts_stream(ws, speak_text)
-                except Exception as exc:
-                    # Fallback: single WAV blob
-                    try:
-                        tts = await _tts_payload(speak_text)
-                        if tts.get("audio_b64"):
-                            await ws.send(json.dumps({"type": "tts_audio", **tts}))
-                    except Exception:
-                        await ws.send(
-                            json.dumps({"type": "error", "error": f"TTS failed: {exc}"})
-                        )
-            elif msg_type == "text":
-                text = (data.get("text") or "").strip()
-                if not text:
-                    await ws.send(json.dumps({"type": "error", "error": "No text provided"}))
-                    continue
-                print(f"[ws] text: {text!r}", flush=True)
-                try:
-                    inputs = (
-                        Command(resume=text)
-                        if awaiting_resume
-                        else {"messages": [HumanMessage(content=text)]}
-                    )
-                    result = await asyncio.wait_for(
-                        _invoke_graph(inputs, config, mode=guardrails_mode), timeout=45
-                    )
-                except asyncio.TimeoutError:
-                    await ws.send(
-                        json.dumps(
-                            {
-                                "type": "error",
-                                "error": "Graph invoke timed out (45s). Check MODEL_NAME/BASE_URL/API_KEY connectivity.",
-                            }
-                        )
-                    )
-                    continue
-                interrupt_values = _interrupt_values(result)
-                awaiting_resume = bool(interrupt_values)
-                await ws.send(
-                    json.dumps(
-                        {
-                            "type": "graph_result",
-                            "pizza_type": result.get("pizza_type", ""),
-                            "messages": _safe_messages(result),
-                            "interrupt": interrupt_values[0]
-                            if interrupt_values
-                            else None,
-                        }
-                    )
-                )
-                speak_text = _select_tts_text(result)
-                try:
-                    await _tts_stream(ws, speak_text)
-                except Exception as exc:
-                    # Fallback: single WAV blob
-                    try:
-                        tts = await _tts_payload(speak_text)
-                        if tts.get("audio_b64"):
-                            await ws.send(json.dumps({"type": "tts_audio", **tts}))
-                    except Exception:
-                        await ws.send(
-                            json.dumps({"type": "error", "error": f"TTS failed: {exc}"})
-                        )
-            elif msg_type == "tts_text":
-                # Debug / testing endpoint: stream TTS audio directly without invoking the graph.
-                speak_text = (data.get("text") or "").strip()
-                if not speak_text:
-                    await ws.send(json.dumps({"type": "error", "error": "No text provided"}))
+    try:
+        while True:
+            try:
+                raw = await ws.recv()
+                if isinstance(raw, (bytes, bytearray)):
+                    # Binary fast path: the frame is the WAV itself — no JSON
+                    # wrapper to parse, no 33% base64 inflation to decode.
+                    await jobs.put(("audio", bytes(raw)))
                     continue
-                try:
-                    await _tts_stream(ws, speak_text)
-                except Exception as exc:
+                data = _loads(raw)
+                msg_type = data.get("type")
+                if msg_type == "audio_wav_b64":
+                    b64 = data.get("audio_b64") or ""
+                    if not b64:
+                        await ws.send(_ERR_NO_AUDIO)
+                        continue
+                    # Decode happens with STT on the worker thread, not here.
+                    await jobs.put(("audio_b64", b64))
+                elif msg_type == "text":
+                    text = (data.get("text") or "").strip()
+                    if not text:
+                        await ws.send(_ERR_NO_TEXT)
+                        continue
+                    logger.info("[ws] text: %r", text)
+                    await jobs.put(("text", text))
+                elif msg_type == "tts_text":
+                    speak_text = (data.get("text") or "").strip()
+                    if not speak_text:
+                        await ws.send(_ERR_NO_TEXT)
+                        continue
+                    await jobs.put(("tts", speak_text))
+                elif msg_type == "set_guardrails":
+                    guardrails_enabled = bool(data.get("enabled", False))
+                    guardrails_mode = "fms" if guardrails_enabled else "none"
+                    logger.info("[ws] guardrails mode=%s", guardrails_mode)
+                    await ws.send(_dumps({"type": "guardrails_status", "enabled": guardrails_enabled}))
+                elif msg_type == "set_guardrails_mode":
+                    requested_mode = data.get("mode", "none")
+                    if requested_mode in ("none", "fms", "nemo", "both"):
+                        guardrails_mode = requested_mode
+                    else:
+                        guardrails_mode = "none"
+                    logger.info("[ws] guardrails mode=%s", guardrails_mode)
+                    await ws.send(_dumps({"type": "guardrails_mode", "mode": guardrails_mode}))
+                else:
                     await ws.send(
-                        json.dumps(
-                            {"type": "error", "error": f"TTS stream failed: {exc}"}
-                        )
+                        _dumps({"type": "error", "error": f"Unknown type: {msg_type}"})
                     )
-            elif msg_type == "set_guardrails":
-                guardrails_enabled = bool(data.get("enabled", False))
-                guardrails_mode = "fms" if guardrails_enabled else "none"
-                print(f"[ws] guardrails mode={guardrails_mode}", flush=True)
-                await ws.send(json.dumps({"type": "guardrails_status", "enabled": guardrails_enabled}))
-            elif msg_type == "set_guardrails_mode":
-                requested_mode = data.get("mode", "none")
-                if requested_mode in ("none", "fms", "nemo", "both"):
-                    guardrails_mode = requested_mode
-                else:
-                    guardrails_mode = "none"
-                print(f"[ws] guardrails mode={guardrails_mode}", flush=True)
-                await ws.send(json.dumps({"type": "guardrails_mode", "mode": guardrails_mode}))
-            else:
-                await ws.send(
-                    json.dumps({"type": "error", "error": f"Unknown type: {msg_type}"})
-                )
-        except ConnectionClosed:
-            # Client disconnected; nothing more to do for this connection.
-            break
-        except Exception as exc:
-            print(f"[ws] error: {exc}", flush=True)
-            try:
-                await ws.send(json.dumps({"type": "error", "error": str(exc)}))
             except ConnectionClosed:
+                # Client disconnected; nothing more to do for this connection.
                 break
+            except Exception as exc:
+                logger.exception("[ws] error: %s", exc)
+                try:
+                    await ws.send(_dumps({"type": "error", "error": str(exc)}))
+                except ConnectionClosed:
+                    break
+    finally:
+        worker.cancel()
 
 
 async def main(host: str = "0.0.0.0", port: int = 8765):
@@ -360,7 +651,7 @@ async def main(host: str = "0.0.0.0", port: int = 8765):
     stop_event = asyncio.Event()
 
     def _request_shutdown(signame: str) -> None:
-        print(f"Received {signame}. Forcing shutdown...", flush=True)
+        logger.info("Received %s. Forcing shutdown...", signame)
         # Cancel all tasks so asyncio.run can unwind quickly.
         for task in asyncio.all_tasks(loop):
             task.cancel()
@@ -376,10 +667,33 @@ async def main(host: str = "0.0.0.0", port: int = 8765):
         signal.signal(signal.SIGINT, lambda *_: _request_shutdown("SIGINT"))
         signal.signal(signal.SIGTERM, lambda *_: _request_shutdown("SIGTERM"))
 
-    async with websockets.serve(handler, host, port, max_size=20 * 1024 * 1024):
-        print(f"WS server listening on ws://{host}:{port}", flush=True)
+    # permessage-deflate costs ~2x throughput on the small JSON frames
+    # that dominate this protocol, and the big frames (PCM/WAV audio)
+    # barely compress — so turn compression off entirely.
+    # max_size * max_queue bounds inbound buffering per connection; the
+    # defaults allow far more than any real audio payload here needs.
+    # The 64 KiB write watermark makes slow clients surface as blocked
+    # sends instead of unbounded transport buffers. (No read_limit: the
+    # asyncio implementation that is the websockets default since v14
+    # does not take one — inbound buffering is bounded by max_queue.)
+    async with websockets.serve(
+        handler,
+        host,
+        port,
+        max_size=int(os.getenv("WS_MAX_SIZE", str(20 * 1024 * 1024))),
+        max_queue=int(os.getenv("WS_MAX_QUEUE", "4")),
+        write_limit=2**16,
+        compression=None,
+    ):
+        logger.info("WS server listening on ws://%s:%s", host, port)
         await stop_event.wait()
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:  # pragma: no cover - optional fast event loop
+        pass
     asyncio.run(main())
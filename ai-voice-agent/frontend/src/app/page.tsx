@@ -8,12 +8,16 @@ type WsMsg =
   | { type: "tts_begin"; format: "pcm_s16le"; sample_rate: number }
   | { type: "tts_first_token" }
   | { type: "tts_end" }
+  | { type: "tts_error"; error: string }
   | {
       type: "graph_result";
       pizza_type: string;
       messages: { role: string; content: string }[];
+      delta?: boolean;
       interrupt?: any;
     }
+  | { type: "tts_audio"; format: string; sample_rate: number; len: number }
+  | { type: "batch"; frames: WsMsg[] }
   | { type: "guardrails_available"; available: boolean; fms_guardrails_available?: boolean; nemo_guardrails_available?: boolean }
   | { type: "guardrails_status"; enabled: boolean }
   | { type: "guardrails_mode"; mode: string }
@@ -49,14 +53,6 @@ function pcmToWavBlob(pcm: Int16Array, sampleRate: number): Blob {
   return new Blob([buffer], { type: "audio/wav" });
 }
 
-async function blobToBase64(blob: Blob): Promise<string> {
-  const buf = await blob.arrayBuffer();
-  const bytes = new Uint8Array(buf);
-  let binary = "";
-  for (let i = 0; i < bytes.length; i++) binary += String.fromCharCode(bytes[i]);
-  return btoa(binary);
-}
-
 function bytesToInt16View(bytes: Uint8Array): Int16Array {
   if (bytes.byteLength % 2 === 0 && bytes.byteOffset % 2 === 0) {
     return new Int16Array(bytes.buffer, bytes.byteOffset, bytes.byteLength / 2);
@@ -153,6 +149,8 @@ export default function Home() {
 
   const wsRef = useRef<WebSocket | null>(null);
   const ttsReceivingBinaryRef = useRef<boolean>(false);
+  // Set after a tts_audio header; the next binary frame is a whole WAV.
+  const ttsExpectingWavRef = useRef<boolean>(false);
   const mediaStreamRef = useRef<MediaStream | null>(null);
   const audioCtxRef = useRef<AudioContext | null>(null);
   const processorRef = useRef<ScriptProcessorNode | null>(null);
@@ -251,6 +249,7 @@ export default function Home() {
     ttsPrebufferSamplesRef.current = 0;
     ttsPrebufferingRef.current = true;
     ttsReceivingBinaryRef.current = false;
+    ttsExpectingWavRef.current = false;
     setTtsStreamStatus("idle");
     setWaiting(false);
   };
@@ -362,10 +361,129 @@ export default function Home() {
       scheduleReconnect();
     };
     ws.onerror = () => setError("WebSocket error");
+    const handleJsonMsg = async (msg: WsMsg): Promise<void> => {
+      // Batch envelope: the server coalesces several frames into one
+      // websocket message; unpack and dispatch them in order.
+      if (msg.type === "batch") {
+        for (const frame of msg.frames) {
+          await handleJsonMsg(frame);
+        }
+        return;
+      }
+
+      if (msg.type === "transcript") setTranscript(msg.text);
+
+      if (msg.type === "tts_begin") {
+        stopTtsStream();
+        ttsSampleRateRef.current = msg.sample_rate;
+        ttsReceivingBinaryRef.current = true;
+        ttsFirstAudioAtMsRef.current = 0;
+        ttsFirstTokenAtMsRef.current = 0;
+        setTtsTtftMs(0);
+        setTtsTtfbMs(0);
+        setTtsStreamStatus("buffering");
+        ttsStreamChunksRef.current = 0;
+        ttsStreamBytesRef.current = 0;
+        ttsRxStartedAtMsRef.current = Date.now();
+        ttsRxLastAtMsRef.current = ttsRxStartedAtMsRef.current;
+        ttsRxInSamplesRef.current = 0;
+        setTtsStreamChunks(0);
+        setTtsStreamBytes(0);
+        setTtsGenRealtimeX(0);
+        if (ttsRecordEnabled) {
+          clearTtsRecording();
+          setTtsRecordedSampleRate(msg.sample_rate);
+        }
+        // Ensure AudioContext exists and is running.
+        await ensureTtsContext();
+      }
+
+      if (msg.type === "tts_first_token") {
+        if (ttsFirstTokenAtMsRef.current === 0) {
+          ttsFirstTokenAtMsRef.current = Date.now();
+          if (ttsReqStartedAtMsRef.current > 0) {
+            setTtsTtftMs(ttsFirstTokenAtMsRef.current - ttsReqStartedAtMsRef.current);
+          }
+        }
+      }
+
+      if (msg.type === "tts_end") {
+        ttsReceivingBinaryRef.current = false;
+        if (ttsReqStartedAtMsRef.current > 0 && ttsFirstTokenAtMsRef.current > 0) {
+          setTtsTtftMs(ttsFirstTokenAtMsRef.current - ttsReqStartedAtMsRef.current);
+        }
+        if (ttsReqStartedAtMsRef.current > 0 && ttsFirstAudioAtMsRef.current > 0) {
+          setTtsTtfbMs(ttsFirstAudioAtMsRef.current - ttsReqStartedAtMsRef.current);
+        }
+        // Flush any remaining prebuffer
+        const ctx = ttsCtxRef.current;
+        const inRate = ttsSampleRateRef.current || 24000;
+        if (ctx && ttsPrebufferingRef.current && ttsPrebufferChunksRef.current.length > 0) {
+          flushPrebuffer(ctx, inRate);
+        }
+        setTtsStreamStatus("draining");
+        finalizeTtsRecording();
+        // Wait for scheduled audio to finish, then clean up.
+        const endTime = ttsNextPlayTimeRef.current;
+        const check = setInterval(() => {
+          const c = ttsCtxRef.current;
+          if (!c || c.currentTime >= endTime) {
+            stopTtsStream();
+            clearInterval(check);
+          }
+        }, 200);
+      }
+
+      if (msg.type === "tts_error") {
+        // Single frame that both reports the failure and ends the stream.
+        setError(msg.error);
+        stopTtsStream();
+      }
+
+      if (msg.type === "tts_audio") {
+        ttsExpectingWavRef.current = true;
+      }
+
+      if (msg.type === "graph_result") {
+        setPizzaType(msg.pizza_type);
+        // Delta frames carry only messages added since the last turn.
+        if (msg.delta) {
+          setMessages((prev) => [...prev, ...msg.messages]);
+        } else {
+          setMessages(msg.messages);
+        }
+      }
+      if (msg.type === "guardrails_available") {
+        setGuardrailsAvailable(msg.available);
+        setFmsAvailable(msg.fms_guardrails_available ?? msg.available);
+        setNemoAvailable(msg.nemo_guardrails_available ?? false);
+      }
+      if (msg.type === "guardrails_status") {
+        setGuardrailsEnabled(msg.enabled);
+      }
+      if (msg.type === "guardrails_mode") {
+        setGuardrailsMode(msg.mode);
+      }
+      if (msg.type === "error") setError(msg.error);
+    };
+
     ws.onmessage = async (evt) => {
       try {
         // ── Binary frames: TTS audio chunks ──
         if (typeof evt.data !== "string") {
+          // Fallback path: one self-contained WAV announced by tts_audio.
+          if (ttsExpectingWavRef.current) {
+            ttsExpectingWavRef.current = false;
+            const playWav = (buf: ArrayBuffer) => {
+              const url = URL.createObjectURL(new Blob([buf], { type: "audio/wav" }));
+              const audio = new Audio(url);
+              audio.onended = () => URL.revokeObjectURL(url);
+              void audio.play().catch(() => URL.revokeObjectURL(url));
+            };
+            if (evt.data instanceof ArrayBuffer) playWav(evt.data);
+            else if (evt.data instanceof Blob) void evt.data.arrayBuffer().then(playWav);
+            return;
+          }
           if (!ttsReceivingBinaryRef.current) return;
           const handleBuffer = async (buf: ArrayBuffer) => {
             const len = buf.byteLength;
@@ -418,86 +536,7 @@ export default function Home() {
         }
 
         // ── JSON messages ──
-        const msg = JSON.parse(evt.data) as WsMsg;
-        if (msg.type === "transcript") setTranscript(msg.text);
-
-        if (msg.type === "tts_begin") {
-          stopTtsStream();
-          ttsSampleRateRef.current = msg.sample_rate;
-          ttsReceivingBinaryRef.current = true;
-          ttsFirstAudioAtMsRef.current = 0;
-          ttsFirstTokenAtMsRef.current = 0;
-          setTtsTtftMs(0);
-          setTtsTtfbMs(0);
-          setTtsStreamStatus("buffering");
-          ttsStreamChunksRef.current = 0;
-          ttsStreamBytesRef.current = 0;
-          ttsRxStartedAtMsRef.current = Date.now();
-          ttsRxLastAtMsRef.current = ttsRxStartedAtMsRef.current;
-          ttsRxInSamplesRef.current = 0;
-          setTtsStreamChunks(0);
-          setTtsStreamBytes(0);
-          setTtsGenRealtimeX(0);
-          if (ttsRecordEnabled) {
-            clearTtsRecording();
-            setTtsRecordedSampleRate(msg.sample_rate);
-          }
-          // Ensure AudioContext exists and is running.
-          await ensureTtsContext();
-        }
-
-        if (msg.type === "tts_first_token") {
-          if (ttsFirstTokenAtMsRef.current === 0) {
-            ttsFirstTokenAtMsRef.current = Date.now();
-            if (ttsReqStartedAtMsRef.current > 0) {
-              setTtsTtftMs(ttsFirstTokenAtMsRef.current - ttsReqStartedAtMsRef.current);
-            }
-          }
-        }
-
-        if (msg.type === "tts_end") {
-          ttsReceivingBinaryRef.current = false;
-          if (ttsReqStartedAtMsRef.current > 0 && ttsFirstTokenAtMsRef.current > 0) {
-            setTtsTtftMs(ttsFirstTokenAtMsRef.current - ttsReqStartedAtMsRef.current);
-          }
-          if (ttsReqStartedAtMsRef.current > 0 && ttsFirstAudioAtMsRef.current > 0) {
-            setTtsTtfbMs(ttsFirstAudioAtMsRef.current - ttsReqStartedAtMsRef.current);
-          }
-          // Flush any remaining prebuffer
-          const ctx = ttsCtxRef.current;
-          const inRate = ttsSampleRateRef.current || 24000;
-          if (ctx && ttsPrebufferingRef.current && ttsPrebufferChunksRef.current.length > 0) {
-            flushPrebuffer(ctx, inRate);
-          }
-          setTtsStreamStatus("draining");
-          finalizeTtsRecording();
-          // Wait for scheduled audio to finish, then clean up.
-          const endTime = ttsNextPlayTimeRef.current;
-          const check = setInterval(() => {
-            const c = ttsCtxRef.current;
-            if (!c || c.currentTime >= endTime) {
-              stopTtsStream();
-              clearInterval(check);
-            }
-          }, 200);
-        }
-
-        if (msg.type === "graph_result") {
-          setPizzaType(msg.pizza_type);
-          setMessages(msg.messages);
-        }
-        if (msg.type === "guardrails_available") {
-          setGuardrailsAvailable(msg.available);
-          setFmsAvailable(msg.fms_guardrails_available ?? msg.available);
-          setNemoAvailable(msg.nemo_guardrails_available ?? false);
-        }
-        if (msg.type === "guardrails_status") {
-          setGuardrailsEnabled(msg.enabled);
-        }
-        if (msg.type === "guardrails_mode") {
-          setGuardrailsMode(msg.mode);
-        }
-        if (msg.type === "error") setError(msg.error);
+        await handleJsonMsg(JSON.parse(evt.data) as WsMsg);
       } catch (e) {
         console.error("WS message handling failed:", e);
       }
@@ -594,10 +633,11 @@ export default function Home() {
       offset += c.length;
     }
     const wav = pcmToWavBlob(joined, sampleRate);
-    const b64 = await blobToBase64(wav);
     setStatus("sending");
     setWaiting(true);
-    wsRef.current?.send(JSON.stringify({ type: "audio_wav_b64", audio_b64: b64 }));
+    // Binary fast path: the server accepts raw WAV frames directly,
+    // skipping base64 encode here and decode server-side.
+    wsRef.current?.send(wav);
     setStatus("sent (awaiting response)");
   };
 
@@ -688,8 +728,7 @@ export default function Home() {
     ttsFirstAudioAtMsRef.current = 0;
     setTtsTtftMs(0);
     setTtsTtfbMs(0);
-    const b64 = await blobToBase64(file);
-    wsRef.current.send(JSON.stringify({ type: "audio_wav_b64", audio_b64: b64 }));
+    wsRef.current.send(file);
   };
 
   useEffect(() => {